@@ -1,31 +1,30 @@
 from warnings import warn
 
-from pyocomm.core.ocomm import OCOMM
-from pyocomm.obare.obare import OBARE
-from pyocomm.ompi.ompi import OMPI
-from pyocomm.onccl.onccl import ONCCL
-
 backend_flags = {
     "cupy_avail": False,
     "nccl_avail": False,
     "mpi_avail": False,
-    "mpi_cuda_aware": False,
+    # None until `mpi_cuda_aware` has run.
+    "mpi_cuda_aware": None,
 }
 
 try:
     import cupy as cp
     import cupyx.scipy.linalg as cu_la
 
-    # Check if cupy is actually working. This could still raise
-    # a cudaErrorInsufficientDriver error or something.
-    cp.abs(1)
-    backend_flags["cupy_avail"] = True
-
-    from cupy.cuda import nccl
-    if nccl.available:
-        backend_flags["nccl_avail"] = True
+    # Check if cupy is actually working, without allocating or launching
+    # anything on the device.
+    try:
+        device_count = cp.cuda.runtime.getDeviceCount()
+    except cp.cuda.runtime.CUDARuntimeError:
+        device_count = 0
+
+    if device_count > 0:
+        backend_flags["cupy_avail"] = True
+        # NCCL is loaded on first use, see `pyocomm.onccl.onccl._ensure_nccl`.
+        backend_flags["nccl_avail"] = None
     else:
-        warn("NCCL is not available.")
+        warn("'CuPy' is unavailable. (No CUDA device found)")
 except (ImportError, ImportWarning, ModuleNotFoundError) as w:
     warn(f"'CuPy' is unavailable. ({w})")
 
@@ -34,35 +33,24 @@ try:
     from mpi4py import MPI
 
     backend_flags["mpi_avail"] = True
-
-    if backend_flags["cupy_avail"]:
-        # Check if MPI is CUDA-aware
-        try:
-            comm = MPI.COMM_WORLD
-            comm_rank = comm.Get_rank()
-            comm_size = comm.Get_size()
-
-            # Create a small GPU array
-            gpu_array = cp.array([comm_rank], dtype=cp.float32)
-
-            # Perform an MPI operation on the GPU array
-            if comm_size > 1:
-                if comm_rank == 0:
-                    comm.Send([gpu_array, MPI.FLOAT], dest=1)
-                elif comm_rank == 1:
-                    comm.Recv([gpu_array, MPI.FLOAT], source=0)
-
-            backend_flags["mpi_cuda_aware"] = True
-        except Exception as e:
-            warn(f"MPI is not CUDA-aware. ({e})")
-
 except (ImportError, ImportWarning, ModuleNotFoundError) as w:
     warn(f"'mpi4py' is unavailable. ({w})")
 
+# The backends read the flags at import time, so they are imported once the
+# flags are set.
+from pyocomm.core.ocomm import OCOMM
+from pyocomm.core.factory import make_comm
+from pyocomm.core.probe import mpi_cuda_aware
+from pyocomm.obare.obare import OBARE
+from pyocomm.ompi.ompi import OMPI
+from pyocomm.onccl.onccl import ONCCL
+
 __all__ = [
     "OCOMM",
     "OBARE",
     "OMPI",
     "ONCCL",
     "backend_flags",
+    "make_comm",
+    "mpi_cuda_aware",
 ]
\ No newline at end of file
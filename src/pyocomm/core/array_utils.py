@@ -0,0 +1,89 @@
+from numpy.typing import ArrayLike
+
+from pyocomm import backend_flags
+
+import numpy as np
+
+if backend_flags["cupy_avail"]:
+    import cupy as cp
+
+# Bound once at import time, so that the per-call checks are a single
+# isinstance. The empty tuple never matches.
+_cupy_ndarray = cp.ndarray if backend_flags["cupy_avail"] else ()
+
+def _get_module_from_array(arr: ArrayLike):
+    """Return the array module of the input array.
+
+    Parameters
+    ----------
+    arr : ArrayLike
+        Input array.
+
+    Returns
+    -------
+    module : module
+        The array module of the input array. (numpy or cupy)
+    la : module
+        The linear algebra module of the array module. (scipy.linalg or cupyx.scipy.linalg)
+    """
+    if isinstance(arr, _cupy_ndarray):
+        return cp
+
+    return np
+
+
+def _is_gpu(arr: ArrayLike) -> bool:
+    """Return whether the input array lives on the device.
+
+    Parameters
+    ----------
+    arr : ArrayLike
+        Input array.
+
+    Returns
+    -------
+    is_gpu : bool
+        True if the input array is a cupy array.
+    """
+    return isinstance(arr, _cupy_ndarray)
+
+
+def _get_data_ptr(arr: ArrayLike) -> int:
+    """Return the address of the first element of the input array.
+
+    Parameters
+    ----------
+    arr : ArrayLike
+        Input array.
+
+    Returns
+    -------
+    ptr : int
+        The host or device address of the array data.
+    """
+    if _is_gpu(arr):
+        return arr.data.ptr
+
+    return arr.ctypes.data
+
+
+def _may_share_memory(a: ArrayLike, b: ArrayLike) -> bool:
+    """Return whether two arrays might overlap in memory.
+
+    Parameters
+    ----------
+    a : ArrayLike
+        First array.
+    b : ArrayLike
+        Second array.
+
+    Returns
+    -------
+    may_share : bool
+        True if the memory bounds of the arrays overlap. Host and device
+        arrays never do.
+    """
+    if _is_gpu(a) != _is_gpu(b):
+        return False
+
+    return bool(_get_module_from_array(a).may_share_memory(a, b))
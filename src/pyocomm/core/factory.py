@@ -0,0 +1,49 @@
+# Copyright 2023-2024 ETH Zurich and Quantum Transport Toolbox authors.
+
+from numpy.typing import ArrayLike
+
+from pyocomm.core.ocomm import OCOMM
+
+
+def make_comm(*arrs: ArrayLike, comm=None) -> OCOMM:
+    """
+    Get the communicator best suited to the arrays to communicate.
+
+    Parameters:
+    arrs (ArrayLike): The arrays that will be communicated.
+    comm (MPI.Comm, optional): The MPI communicator to wrap. Defaults to MPI.COMM_WORLD.
+
+    Returns:
+    OCOMM: ONCCL, shared by the calls on the same MPI communicator, if
+        NCCL is available and all the arrays are device arrays, ODAMPI if
+        some arrays are device arrays, OMPI otherwise, and OBARE if MPI is
+        unavailable.
+    """
+    # Imported here as the backends themselves import the package.
+    from pyocomm import backend_flags
+
+    if not backend_flags["mpi_avail"]:
+        from pyocomm.obare.obare import OBARE
+        return OBARE()
+
+    from mpi4py import MPI
+    from pyocomm.core.array_utils import _is_gpu
+
+    if comm is None:
+        comm = MPI.COMM_WORLD
+
+    on_device = [_is_gpu(arr) for arr in arrs]
+
+    if on_device and all(on_device):
+        from pyocomm.onccl.onccl import _cached_onccl, _ensure_nccl
+        if _ensure_nccl():
+            # Creating an NCCL communicator is expensive, it is made once
+            # per MPI communicator.
+            return _cached_onccl(comm)
+
+    if any(on_device):
+        from pyocomm.odampi.odampi import ODAMPI
+        return ODAMPI(comm)
+
+    from pyocomm.ompi.ompi import OMPI
+    return OMPI(comm)
@@ -0,0 +1,114 @@
+# Copyright 2023-2024 ETH Zurich and Quantum Transport Toolbox authors.
+
+import threading
+from typing import Callable
+
+
+class _Req:
+    """Handle on a pending non-blocking communication."""
+    def __init__(self, wait_fn: Callable[[], None]):
+        self._wait_fn = wait_fn
+        self._done = False
+
+    def wait(self) -> None:
+        """
+        Block until the communication has completed.
+
+        Calling `wait` on a completed request is a no-op.
+        """
+        if not self._done:
+            self._wait_fn()
+            self._done = True
+
+
+class _PersistentReq:
+    """Handle on a persistent communication, started and waited on repeatedly."""
+    def __init__(
+            self,
+            request,
+            pre_start: None | Callable[[], None] = None,
+            post_wait: None | Callable[[], None] = None,
+        ):
+        self._request = request
+        self._pre_start = pre_start
+        self._post_wait = post_wait
+
+    def start(self) -> None:
+        """
+        Start one instance of the communication.
+        """
+        if self._pre_start is not None:
+            self._pre_start()
+        self._request.Start()
+
+    def wait(self) -> None:
+        """
+        Block until the started instance of the communication has completed.
+        """
+        self._request.Wait()
+        if self._post_wait is not None:
+            self._post_wait()
+
+    def free(self) -> None:
+        """
+        Release the underlying MPI request.
+        """
+        self._request.Free()
+
+
+class _ProgressThread(threading.Thread):
+    """Daemon thread testing pending MPI requests to drive their progress.
+
+    Useful with MPI libraries without an asynchronous progress engine, where
+    non-blocking communications otherwise only advance inside MPI calls. MPI
+    must be initialized with `MPI.THREAD_MULTIPLE`.
+
+    Parameters:
+    interval (float, optional): Time in seconds between two rounds of tests.
+        Defaults to 0.002.
+    """
+    def __init__(self, interval: float = 0.002):
+        super().__init__(daemon=True)
+
+        self._interval = interval
+        self._requests: list = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def add(self, request) -> None:
+        """
+        Start testing a pending MPI request.
+
+        Parameters:
+        request (MPI.Request): The request to drive.
+        """
+        with self._lock:
+            self._requests.append(request)
+
+    def wait(self, request) -> None:
+        """
+        Stop testing an MPI request and wait for its completion.
+
+        Parameters:
+        request (MPI.Request): A request previously given to `add`.
+        """
+        # The request is removed under the lock, so that it is never used
+        # concurrently by both threads.
+        with self._lock:
+            if request in self._requests:
+                self._requests.remove(request)
+        request.Wait()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            with self._lock:
+                self._requests = [
+                    request for request in self._requests if not request.Test()
+                ]
+
+    def stop(self) -> None:
+        """
+        Stop the thread and wait for it to exit.
+        """
+        self._stop_event.set()
+        self.join()
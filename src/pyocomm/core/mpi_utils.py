@@ -0,0 +1,143 @@
+# Copyright 2023-2024 ETH Zurich and Quantum Transport Toolbox authors.
+
+from __future__ import annotations
+
+from numpy.typing import ArrayLike
+
+from pyocomm import backend_flags
+from pyocomm.core.array_utils import _get_data_ptr, _is_gpu
+
+import numpy as np
+
+if backend_flags["mpi_avail"]:
+    from mpi4py import MPI
+
+    # Built once at import time so that the per-call lookup is a single
+    # dictionary access.
+    _MPI_DTYPE_MAP = {
+        np.dtype(np.bool_): MPI.C_BOOL,
+        np.dtype(np.int8): MPI.INT8_T,
+        np.dtype(np.int16): MPI.INT16_T,
+        np.dtype(np.int32): MPI.INT32_T,
+        np.dtype(np.int64): MPI.INT64_T,
+        np.dtype(np.uint8): MPI.UINT8_T,
+        np.dtype(np.uint16): MPI.UINT16_T,
+        np.dtype(np.uint32): MPI.UINT32_T,
+        np.dtype(np.uint64): MPI.UINT64_T,
+        np.dtype(np.float32): MPI.FLOAT,
+        np.dtype(np.float64): MPI.DOUBLE,
+        np.dtype(np.complex64): MPI.C_FLOAT_COMPLEX,
+        np.dtype(np.complex128): MPI.C_DOUBLE_COMPLEX,
+    }
+
+    _OP_MAP = {
+        "sum": MPI.SUM,
+        "prod": MPI.PROD,
+        "max": MPI.MAX,
+        "min": MPI.MIN,
+        "land": MPI.LAND,
+        "lor": MPI.LOR,
+        "band": MPI.BAND,
+        "bor": MPI.BOR,
+    }
+
+
+# Contiguous byte datatypes standing in for the dtypes MPI has no type for,
+# keyed by item size and committed on first use.
+_BYTES_DTYPES: dict = {}
+
+
+def _mpi_dtype(arr: ArrayLike, reduction: bool = False) -> MPI.Datatype:
+    """
+    Get the MPI datatype matching the dtype of an array.
+
+    Dtypes without an MPI counterpart (e.g., float16) are moved as blocks of
+    bytes of their item size, which keeps the counts in elements. They
+    cannot be reduced.
+
+    Parameters:
+    arr (ArrayLike): The array to communicate.
+    reduction (bool, optional): Whether the data is reduced. Defaults to False.
+
+    Returns:
+    MPI.Datatype: The matching MPI datatype.
+    """
+    dtype = _MPI_DTYPE_MAP.get(arr.dtype)
+    if dtype is not None:
+        return dtype
+
+    if reduction:
+        raise ValueError(f"Unsupported dtype for MPI reductions: {arr.dtype}.")
+
+    itemsize = arr.dtype.itemsize
+    dtype = _BYTES_DTYPES.get(itemsize)
+    if dtype is None:
+        dtype = _BYTES_DTYPES[itemsize] = MPI.BYTE.Create_contiguous(itemsize).Commit()
+
+    return dtype
+
+
+def _mpi_op(op: str | MPI.Op) -> MPI.Op:
+    """
+    Get the MPI reduction operation matching an operation name.
+
+    Parameters:
+    op (str | MPI.Op): The reduction operation (e.g., 'sum', 'max'). An
+        MPI.Op is used as is.
+
+    Returns:
+    MPI.Op: The matching MPI operation.
+    """
+    if isinstance(op, MPI.Op):
+        return op
+
+    try:
+        return _OP_MAP[op]
+    except KeyError:
+        raise ValueError(f"Invalid reduction operation: {op}.")
+
+
+def _check_contiguous(*arrs: ArrayLike) -> None:
+    """
+    Check that arrays can be handed to MPI as a single memory block.
+
+    Parameters:
+    arrs (ArrayLike): The arrays to check. None entries, for buffers that
+        are not significant on this rank, are skipped.
+    """
+    for arr in arrs:
+        if arr is not None and not arr.flags["C_CONTIGUOUS"]:
+            raise ValueError("Communication buffers must be C-contiguous.")
+
+
+def _is_in_place(send_data: ArrayLike, recv_data: ArrayLike, offset: int = 0) -> bool:
+    """
+    Check whether the send data lies in the receive buffer.
+
+    Parameters:
+    send_data (ArrayLike): The data to send.
+    recv_data (ArrayLike): The buffer to receive the data.
+    offset (int, optional): The byte offset of the send data in the receive
+        buffer. Defaults to 0.
+
+    Returns:
+    bool: True if the send data starts `offset` bytes into the receive buffer.
+    """
+    if send_data is recv_data:
+        return offset == 0
+
+    # Reading the data pointers is costly on small messages, only arrays
+    # viewing one another or a common base can alias.
+    send_base = send_data.base
+    recv_base = recv_data.base
+    if (
+        send_base is not recv_data
+        and recv_base is not send_data
+        and (send_base is None or send_base is not recv_base)
+    ):
+        return False
+
+    return (
+        _is_gpu(send_data) == _is_gpu(recv_data)
+        and _get_data_ptr(send_data) == _get_data_ptr(recv_data) + offset
+    )
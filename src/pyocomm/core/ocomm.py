@@ -1,15 +1,22 @@
 # Copyright 2023-2024 ETH Zurich and Quantum Transport Toolbox authors.
 
-from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Protocol, runtime_checkable
+
 from numpy.typing import ArrayLike
 
-class OCOMM(ABC):
-    """Base class for communication backends."""
-    def __init__(self):
-        ...
+@runtime_checkable
+class OCOMM(Protocol):
+    """Interface of the communication backends.
+
+    A structural protocol: the backends subclass it to inherit the default
+    grouping methods, but any object with the same methods type-checks as an
+    OCOMM. Calls are plain method lookups, with no abstract method machinery.
+    It is runtime checkable, so `isinstance(comm, OCOMM)` holds for the
+    backends and for any object providing all the methods.
+    """
 
     # Point-to-point communication (blocking) --------------------------------
-    @abstractmethod
     def send(self, data: ArrayLike, dest: int, tag: int = 0) -> None:
         """
         Send data from one process to another.
@@ -21,7 +28,6 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
     def recv(self, buf: ArrayLike, source: int, tag: int = 0) -> None:
         """
         Receive data from another process.
@@ -37,7 +43,6 @@ class OCOMM(ABC):
     ...
 
     # Collective communication (blocking) -------------------------------------
-    @abstractmethod
     def bcast(self, data: ArrayLike, root: int = 0) -> ArrayLike:
         """
         Broadcast data from one process to all others.
@@ -51,7 +56,6 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
     def scatter(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0) -> None:
         """
         Scatter data from one process to all others.
@@ -63,7 +67,6 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
     def gather(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0) -> None:
         """
         Gather data from all processes to one.
@@ -75,7 +78,6 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
     def allgather(self, send_data: ArrayLike, recv_data: ArrayLike) -> None:
         """
         Gather data from all processes to all.
@@ -86,7 +88,6 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
     def reduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, root: int = 0) -> None:
         """
         Reduce data from all processes to one.
@@ -99,8 +100,7 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
-    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str) -> None:
+    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, async_op: bool = False):
         """
         Reduce data from all processes to all.
 
@@ -108,10 +108,15 @@ class OCOMM(ABC):
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the reduced data.
         op (str): The reduction operation (e.g., 'sum', 'max').
+        async_op (bool, optional): If True, return without waiting for the
+            reduction to complete. Defaults to False.
+
+        Returns:
+        None | request: With `async_op`, a request whose `wait` method
+            blocks until the receive buffer holds the result.
         """
         pass
 
-    @abstractmethod
     def alltoall(self, send_data: ArrayLike, recv_data: ArrayLike) -> None:
         """
         Send data from all processes to all.
@@ -125,8 +130,37 @@ class OCOMM(ABC):
     # Collective communication (non-blocking) ---------------------------------
         ...
 
+    # Grouping ----------------------------------------------------------------
+    def group_start(self) -> None:
+        """
+        Start grouping the following collectives.
+
+        Backends able to batch collectives defer them until `group_end`. The
+        default does nothing and runs every collective immediately.
+        """
+        pass
+
+    def group_end(self) -> None:
+        """
+        Submit the collectives grouped since `group_start`.
+        """
+        pass
+
+    @contextmanager
+    def group(self):
+        """
+        Group the collectives issued within the context.
+
+        The receive buffers must not be read before the context exits, and
+        every rank must issue the same sequence of collectives.
+        """
+        self.group_start()
+        try:
+            yield self
+        finally:
+            self.group_end()
+
     # Synchronization ---------------------------------------------------------
-    @abstractmethod
     def barrier(self) -> None:
         """
         Synchronize all processes.
@@ -134,7 +168,6 @@ class OCOMM(ABC):
         pass
 
     # Communicators -----------------------------------------------------------
-    @abstractmethod    
     def split(self, color: int, key: int) -> 'OCOMM':
         """
         Split the communicator into subgroups.
@@ -148,7 +181,6 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
     def dup(self) -> 'OCOMM':
         """
         Duplicate the communicator.
@@ -159,7 +191,6 @@ class OCOMM(ABC):
         pass
 
     # Process management -------------------------------------------------------
-    @abstractmethod
     def rank(self) -> int:
         """
         Get the rank of the process.
@@ -169,7 +200,6 @@ class OCOMM(ABC):
         """
         pass
 
-    @abstractmethod
     def size(self) -> int:
         """
         Get the size of the communicator.
@@ -0,0 +1,121 @@
+# Copyright 2023-2024 ETH Zurich and Quantum Transport Toolbox authors.
+
+import hashlib
+import os
+import socket
+from functools import lru_cache
+from warnings import warn
+
+from pyocomm import backend_flags
+
+
+def _cache_path() -> str:
+    """
+    Get the file caching the CUDA-aware check for this MPI library and host.
+
+    Returns:
+    str: The path of the cache file, under `$XDG_CACHE_HOME/pyocomm`.
+    """
+    from mpi4py import MPI
+
+    key = hashlib.blake2s(
+        (MPI.Get_library_version() + socket.gethostname()).encode()
+    ).hexdigest()[:16]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(cache_home, "pyocomm", f"mpi_cuda_aware_{key}")
+
+
+def _read_cache(path: str) -> None | bool:
+    """
+    Read a cached CUDA-aware check.
+
+    Parameters:
+    path (str): The path of the cache file.
+
+    Returns:
+    None | bool: The cached outcome, None if there is none.
+    """
+    try:
+        with open(path) as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+
+    return value == "1" if value in ("0", "1") else None
+
+
+def _write_cache(path: str, cuda_aware: bool) -> None:
+    """
+    Cache the outcome of the CUDA-aware check, ignoring write failures.
+
+    Parameters:
+    path (str): The path of the cache file.
+    cuda_aware (bool): The outcome of the check.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written aside and renamed, so that concurrent ranks never read a
+        # partial file.
+        tmp_path = f"{path}.{os.getpid()}"
+        with open(tmp_path, "w") as f:
+            f.write(str(int(cuda_aware)))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def mpi_cuda_aware() -> bool:
+    """
+    Check whether MPI can communicate device arrays directly.
+
+    The check runs once per process, on first use, and its outcome is
+    cached on disk per MPI library version and host. The outcome can be
+    given (or inherited from a parent process) through the
+    `PYOCOMM_MPI_CUDA_AWARE` environment variable, set to "0" or "1", which
+    takes precedence over the cache. The result is also stored in
+    `backend_flags["mpi_cuda_aware"]`.
+
+    Returns:
+    bool: True if MPI is CUDA-aware.
+    """
+    cuda_aware = False
+
+    mpi_cuda_aware_env = os.environ.get("PYOCOMM_MPI_CUDA_AWARE")
+
+    if mpi_cuda_aware_env in ("0", "1"):
+        cuda_aware = mpi_cuda_aware_env == "1"
+    elif backend_flags["mpi_avail"] and backend_flags["cupy_avail"]:
+        cache_path = _cache_path()
+        cached = _read_cache(cache_path)
+
+        if cached is not None:
+            cuda_aware = cached
+        else:
+            import cupy as cp
+            from mpi4py import MPI
+
+            # A message to self on COMM_SELF keeps the test local, so that it
+            # can run lazily on any subset of the ranks.
+            try:
+                send_byte = cp.zeros(1, dtype=cp.uint8)
+                recv_byte = cp.empty(1, dtype=cp.uint8)
+                MPI.COMM_SELF.Sendrecv(
+                    [send_byte, MPI.BYTE],
+                    dest=0,
+                    recvbuf=[recv_byte, MPI.BYTE],
+                    source=0,
+                )
+                cuda_aware = True
+            except Exception as e:
+                warn(f"MPI is not CUDA-aware. ({e})")
+
+            _write_cache(cache_path, cuda_aware)
+
+        # Child processes inherit the outcome and skip the test.
+        os.environ["PYOCOMM_MPI_CUDA_AWARE"] = str(int(cuda_aware))
+
+    backend_flags["mpi_cuda_aware"] = cuda_aware
+
+    return cuda_aware
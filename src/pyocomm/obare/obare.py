@@ -1,33 +1,98 @@
+import numpy as np
 from numpy.typing import ArrayLike
 
 from pyocomm import OCOMM
+from pyocomm.core.handles import _Req
+from pyocomm.core.array_utils import _get_data_ptr, _get_module_from_array
+
+# Reductions over a single process: the identity for these operations, and
+# a cast to truth values for the logical ones.
+_IDENTITY_OPS = ('sum', 'prod', 'max', 'min', 'band', 'bor')
+_LOGICAL_OPS = ('land', 'lor')
+
+
+def _raw_copy(src: ArrayLike, dst: ArrayLike) -> None:
+    """
+    Copy the content of an array into another one of the same size and dtype.
+
+    Contiguous arrays are copied as raw bytes, which skips the dtype and
+    broadcasting analysis of NumPy's assignment path.
+
+    Parameters:
+    src (ArrayLike): The array to copy from.
+    dst (ArrayLike): The array to copy into.
+    """
+    if src.flags.c_contiguous and dst.flags.c_contiguous:
+        dst.reshape(-1).view(np.uint8)[:] = src.reshape(-1).view(np.uint8)
+    else:
+        # Reshaping a strided destination would copy it, losing the write.
+        xp = _get_module_from_array(dst)
+        xp.copyto(dst, src.reshape(dst.shape), casting='no')
+
+
+def _reduce_single(src: ArrayLike, dst: ArrayLike, op: str) -> None:
+    """
+    Reduce the contribution of a single process.
+
+    Parameters:
+    src (ArrayLike): The data to reduce.
+    dst (ArrayLike): The buffer to receive the reduced data.
+    op (str): The reduction operation (e.g., 'sum', 'max').
+    """
+    if op in _IDENTITY_OPS:
+        # In-place reductions (`src` and `dst` being the same memory) are
+        # then a no-op.
+        if _get_data_ptr(src) != _get_data_ptr(dst) or src.strides != dst.strides:
+            _raw_copy(src, dst)
+    elif op in _LOGICAL_OPS:
+        xp = _get_module_from_array(dst)
+        xp.not_equal(src.reshape(dst.shape), 0, out=dst, casting='unsafe')
+    else:
+        raise ValueError("Invalid reduction operation.")
 
 
 class OBARE(OCOMM):
-    """Oblivious Bare communicator."""
-    def __init__(self):
+    """Oblivious Bare communicator.
+
+    Parameters:
+    zero_copy (bool, optional): If True, `send` keeps a reference to the data
+        instead of a copy, and the data must not be modified until it has
+        been received. Defaults to True.
+    """
+    def __init__(self, zero_copy: bool = True):
         
         self.send_buff: dict = {}
+        self._zero_copy = zero_copy
+        self._rank = 0
+        self._size = 1
 
     # Point-to-point communication (blocking) --------------------------------
     def send(self, data: ArrayLike, dest: int, tag: int = 0) -> None:
         """
         Send data from one process to another.
 
+        In zero-copy mode, or if the data is read-only, the data is not
+        copied and the caller must not modify it until the matching `recv`.
+
         Parameters:
         data (ArrayLike): The data to send.
         dest (int): The rank of the destination process.
         tag (int, optional): The message tag. Defaults to 0.
         """
-        if dest != self.rank():
+        if dest != self._rank:
             raise ValueError("Destination rank must be the same as the source rank.")
 
         if tag not in self.send_buff:
             self.send_buff[tag] = []
 
-        # We purposedly copy the data as send return imediatly and we cannot 
-        # ensure otherwise that the data will not be modified.
-        self.send_buff[tag].append(data.copy()) 
+        # CuPy arrays have no writeable flag, they are always writeable.
+        if self._zero_copy or not getattr(data.flags, "writeable", True):
+            # The matching recv does the single copy into its buffer.
+            self.send_buff[tag].append(data)
+        else:
+            # We purposedly copy the data as send return imediatly and we cannot 
+            # ensure otherwise that the data will not be modified.
+            self.send_buff[tag].append(data.copy()) 
 
 
     def recv(self, buf: ArrayLike, source: int, tag: int = 0) -> None:
@@ -39,13 +104,17 @@ class OBARE(OCOMM):
         source (int): The rank of the source process.
         tag (int, optional): The message tag. Defaults to 0.
         """
-        if source != self.rank():
+        if source != self._rank:
             raise ValueError("Source rank must be the same as the source rank.")
         
-        if tag not in self.send_buff:
+        if not self.send_buff.get(tag):
             raise ValueError("No data to receive.")
-        
-        buf[:] = self.send_buff[tag].pop(0)
+
+        data = self.send_buff[tag][0]
+        if data.nbytes != buf.nbytes or data.dtype != buf.dtype:
+            raise ValueError("Send and receive data sizes and dtypes must match.")
+
+        _raw_copy(self.send_buff[tag].pop(0), buf)
         
 
     # Point-to-point communication (non-blocking) -----------------------------
@@ -63,7 +132,7 @@ class OBARE(OCOMM):
         Returns:
         ArrayLike: The broadcasted data.
         """
-        if root != self.rank():
+        if root != self._rank:
             raise ValueError("Root rank must be the same as the source rank.")
         
         return data
@@ -77,12 +146,12 @@ class OBARE(OCOMM):
         recv_data (ArrayLike): The buffer to receive the scattered data.
         root (int, optional): The rank of the root process. Defaults to 0.
         """
-        if root != self.rank():
+        if root != self._rank:
             raise ValueError("Root rank must be the same as the source rank.")
-        if send_data.shape != recv_data.shape:
-            raise ValueError("Send and receive data shapes must match.")
+        if send_data.nbytes != recv_data.nbytes or send_data.dtype != recv_data.dtype:
+            raise ValueError("Send and receive data sizes and dtypes must match.")
 
-        recv_data[:] = send_data
+        _raw_copy(send_data, recv_data)
 
     def gather(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0) -> None:
         """
@@ -93,12 +162,12 @@ class OBARE(OCOMM):
         recv_data (ArrayLike): The buffer to receive the gathered data.
         root (int, optional): The rank of the root process. Defaults to 0.
         """
-        if root != self.rank():
+        if root != self._rank:
             raise ValueError("Root rank must be the same as the source rank.")
-        if send_data.shape != recv_data.shape:
-            raise ValueError("Send and receive data shapes must match.")
+        if send_data.nbytes != recv_data.nbytes or send_data.dtype != recv_data.dtype:
+            raise ValueError("Send and receive data sizes and dtypes must match.")
 
-        recv_data[:] = send_data
+        _raw_copy(send_data, recv_data)
 
     def allgather(self, send_data: ArrayLike, recv_data: ArrayLike) -> None:
         """
@@ -108,10 +177,10 @@ class OBARE(OCOMM):
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the gathered data.
         """
-        if send_data.shape != recv_data.shape:
-            raise ValueError("Send and receive data shapes must match.")
+        if send_data.nbytes != recv_data.nbytes or send_data.dtype != recv_data.dtype:
+            raise ValueError("Send and receive data sizes and dtypes must match.")
         
-        recv_data[:] = send_data
+        _raw_copy(send_data, recv_data)
 
     def reduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, root: int = 0) -> None:
         """
@@ -123,19 +192,14 @@ class OBARE(OCOMM):
         op (str): The reduction operation (e.g., 'sum', 'max').
         root (int, optional): The rank of the root process. Defaults to 0.
         """
-        if root != self.rank():
+        if root != self._rank:
             raise ValueError("Root rank must be the same as the source rank.")
-        if send_data.shape != recv_data.shape:
-            raise ValueError("Send and receive data shapes must match.")
-        
-        if op not in ['sum', 'max', 'min']:
-            raise ValueError("Invalid reduction operation.")
+        if send_data.nbytes != recv_data.nbytes or send_data.dtype != recv_data.dtype:
+            raise ValueError("Send and receive data sizes and dtypes must match.")
 
+        _reduce_single(send_data, recv_data, op)
 
-        recv_data[:] = send_data
-
-
-    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str) -> None:
+    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, async_op: bool = False) -> None | _Req:
         """
         Reduce data from all processes to all.
 
@@ -143,14 +207,19 @@ class OBARE(OCOMM):
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the reduced data.
         op (str): The reduction operation (e.g., 'sum', 'max').
+        async_op (bool, optional): If True, return without waiting for the
+            reduction to complete. Defaults to False.
+
+        Returns:
+        None | _Req: With `async_op`, an already completed request.
         """
-        if send_data.shape != recv_data.shape:
-            raise ValueError("Send and receive data shapes must match.")
-        
-        if op not in ['sum', 'max', 'min']:
-            raise ValueError("Invalid reduction operation.")
+        if send_data.nbytes != recv_data.nbytes or send_data.dtype != recv_data.dtype:
+            raise ValueError("Send and receive data sizes and dtypes must match.")
+
+        _reduce_single(send_data, recv_data, op)
 
-        recv_data[:] = send_data
+        if async_op:
+            return _Req(lambda: None)
 
     def alltoall(self, send_data: ArrayLike, recv_data: ArrayLike) -> None:
         """
@@ -160,10 +229,10 @@ class OBARE(OCOMM):
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the data.
         """
-        if send_data.shape != recv_data.shape:
-            raise ValueError("Send and receive data shapes must match.")
+        if send_data.nbytes != recv_data.nbytes or send_data.dtype != recv_data.dtype:
+            raise ValueError("Send and receive data sizes and dtypes must match.")
 
-        recv_data[:] = send_data
+        _raw_copy(send_data, recv_data)
 
     # Collective communication (non-blocking) ---------------------------------
         ...
@@ -208,7 +277,7 @@ class OBARE(OCOMM):
         Returns:
         int: The rank of the process.
         """
-        return 0
+        return self._rank
 
     def size(self) -> int:
         """
@@ -217,4 +286,4 @@ class OBARE(OCOMM):
         Returns:
         int: The size of the communicator.
         """
-        return 1
+        return self._size
@@ -1,26 +1,459 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Callable
+from warnings import warn
 
 from numpy.typing import ArrayLike
 
-from pyocomm import OCOMM, backend_flags
-from .utils import _get_module_from_array
+from pyocomm import OCOMM, backend_flags, mpi_cuda_aware
+from pyocomm.core.array_utils import _get_module_from_array, _is_gpu, _may_share_memory
+from pyocomm.core.handles import _PersistentReq, _ProgressThread, _Req
+from pyocomm.core.mpi_utils import _check_contiguous, _is_in_place, _mpi_dtype, _mpi_op
+from .pools import _pinned_pool
 
 import numpy as np
 
 if backend_flags["mpi_avail"]:
     from mpi4py import MPI
 
-if backend_flags["cuda_avail"]:
+if backend_flags["cupy_avail"]:
     import cupy as cp
 
+from pyocomm.onccl.onccl import ONCCL, _NCCL_DTYPE_MAP, _NCCL_OP_MAP, _cached_onccl, _ensure_nccl
+
+# Maximum number of contiguous scratch arrays kept per communicator.
+_SCRATCH_CACHE_SIZE = 8
+
 
 class ODAMPI(OCOMM):
-    """Oblivious Device Aware MPI communicator."""
+    """Oblivious Device Aware MPI communicator.
+
+    Results written to device arrays are ordered on the current CuPy stream:
+    the collectives running on NCCL, and the copies back of the host staged
+    paths, return without waiting for their completion.
+
+    Parameters:
+    comm (MPI.Comm, optional): The MPI communicator. Defaults to MPI.COMM_WORLD.
+    progress (bool, optional): If True, a background thread drives the
+        progress of the non-blocking communications. Requires MPI to be
+        initialized with MPI.THREAD_MULTIPLE. Defaults to False.
+    hierarchical (bool, optional): If True and the ranks span several
+        nodes, NCCL allreduces are split into a node-local NCCL reduce, an
+        MPI allreduce between one leader rank per node, and a node-local
+        NCCL broadcast. Defaults to False.
+    """
     def __init__(
             self,
-            comm : MPI.Comm = MPI.COMM_WORLD,
+            comm : None | MPI.Comm = None,
+            progress: bool = False,
+            hierarchical: bool = False,
         ):
         
+        if comm is None:
+            comm = MPI.COMM_WORLD
+
         self.comm = comm
+        self._rank = comm.Get_rank()
+        self._size = comm.Get_size()
+
+        # Bound once, as in OMPI.
+        self._mpi_allreduce = comm.Allreduce
+        self._mpi_bcast = comm.Bcast
+        self._mpi_barrier = comm.Barrier
+
+        self._cuda_aware = mpi_cuda_aware()
+
+        # Dedicated stream for the host staging copies, so they do not
+        # serialize with the work queued on the user stream.
+        self._xfer_stream = None
+        if backend_flags["cupy_avail"]:
+            self._xfer_stream = cp.cuda.Stream(non_blocking=True)
+
+        # NCCL backend over the same ranks, created on the first collective
+        # that uses it.
+        self._nccl = None
+
+        # Node-local communicator and communicator of the node leaders, for
+        # the hierarchical allreduce. The node-local NCCL backend is created
+        # on first use.
+        self._hierarchical = False
+        self._local_nccl = None
+        if hierarchical:
+            if _ensure_nccl():
+                local_comm = comm.Split_type(MPI.COMM_TYPE_SHARED, key=self._rank)
+                # On a single node, the flat NCCL allreduce is used.
+                if local_comm.Get_size() < self._size:
+                    self._hierarchical = True
+                    self._local_comm = local_comm
+                    self._leaders_comm = comm.Split(
+                        0 if local_comm.Get_rank() == 0 else MPI.UNDEFINED,
+                        self._rank,
+                    )
+                else:
+                    local_comm.Free()
+            else:
+                warn("NCCL is not available, the hierarchical allreduce is disabled.")
+
+        # Contiguous scratch arrays standing in for non-contiguous buffers,
+        # keyed by (role, shape, dtype, is_gpu).
+        self._scratch: dict[tuple, ArrayLike] = {}
+
+        # Allreduce calls recorded inside a `coalesce` context.
+        self._coalescing = False
+        self._pending_allreduce: list[tuple[ArrayLike, ArrayLike, str]] = []
+
+        self._progress = None
+        if progress:
+            if MPI.Query_thread() == MPI.THREAD_MULTIPLE:
+                self._progress = _ProgressThread()
+                self._progress.start()
+            else:
+                warn("MPI is not initialized with MPI.THREAD_MULTIPLE, no progress thread is started.")
+
+    def _to_host(self, data: ArrayLike, host_buffer: np.ndarray, stream: "None | cp.cuda.Stream" = None) -> "cp.cuda.Event":
+        """
+        Queue the copy of a device array into a host buffer.
+
+        The copy runs asynchronously on the given stream, after the work
+        already queued on the current stream. Both arrays must be contiguous
+        and the host buffer must be pinned.
+
+        Parameters:
+        data (ArrayLike): The device array to copy.
+        host_buffer (np.ndarray): The host buffer to copy into.
+        stream (cp.cuda.Stream, optional): The stream running the copy.
+            Defaults to the transfer stream.
+
+        Returns:
+        cp.cuda.Event: An event recorded once the copy is done.
+        """
+        if host_buffer.nbytes != data.nbytes:
+            raise ValueError("Host buffer size must match the data size.")
+        _check_contiguous(host_buffer)
+
+        if stream is None:
+            stream = self._xfer_stream
+
+        current_stream = cp.cuda.get_current_stream()
+        if stream != current_stream:
+            stream.wait_event(current_stream.record())
+        cp.cuda.runtime.memcpyAsync(
+            host_buffer.ctypes.data,
+            data.data.ptr,
+            data.nbytes,
+            cp.cuda.runtime.memcpyDeviceToHost,
+            stream.ptr,
+        )
+
+        return stream.record()
+
+    def _to_device(self, host_buffer: np.ndarray, data: ArrayLike, stream: "None | cp.cuda.Stream" = None) -> "cp.cuda.Event":
+        """
+        Queue the copy of a host buffer into a device array.
+
+        The copy runs asynchronously on the given stream, after the work
+        already queued on the current stream, and the current stream waits
+        for it. Both arrays must be contiguous and the host buffer must be
+        pinned. The returned event only needs to be synchronized on before
+        the host buffer is written again.
+
+        Parameters:
+        host_buffer (np.ndarray): The host buffer to copy.
+        data (ArrayLike): The device array to copy into.
+        stream (cp.cuda.Stream, optional): The stream running the copy.
+            Defaults to the transfer stream.
+
+        Returns:
+        cp.cuda.Event: An event recorded once the copy is done.
+        """
+        if host_buffer.nbytes != data.nbytes:
+            raise ValueError("Host buffer size must match the data size.")
+        _check_contiguous(host_buffer)
+
+        if stream is None:
+            stream = self._xfer_stream
+
+        current_stream = cp.cuda.get_current_stream()
+        if stream != current_stream:
+            stream.wait_event(current_stream.record())
+        cp.cuda.runtime.memcpyAsync(
+            data.data.ptr,
+            host_buffer.ctypes.data,
+            data.nbytes,
+            cp.cuda.runtime.memcpyHostToDevice,
+            stream.ptr,
+        )
+        copied = stream.record()
+        if stream != current_stream:
+            current_stream.wait_event(copied)
+
+        return copied
+
+    def _host_buffer(self, data: ArrayLike, user_buffer: None | ArrayLike) -> tuple[np.ndarray, bool]:
+        """
+        Get the host buffer staging device data.
+
+        Parameters:
+        data (ArrayLike): The device data to stage.
+        user_buffer (ArrayLike, optional): The host buffer given by the
+            caller, if any.
+
+        Returns:
+        tuple[np.ndarray, bool]: The host buffer, and whether it comes from
+            the pinned pool, in which case it must be released.
+        """
+        if user_buffer is None:
+            return _pinned_pool.acquire(data.shape, data.dtype), True
+        if _get_module_from_array(user_buffer) != np:
+            raise ValueError("Host buffer must be on a host array.")
+
+        return user_buffer, False
+
+    def _release_host_buffer(self, host_buffer: np.ndarray, pooled: bool, pending: "None | cp.cuda.Event" = None) -> None:
+        """
+        Give back a host buffer obtained from `_host_buffer`.
+
+        Parameters:
+        host_buffer (np.ndarray): The host buffer.
+        pooled (bool): Whether the buffer comes from the pinned pool.
+        pending (cp.cuda.Event, optional): The event of a queued copy still
+            reading the buffer. Pooled buffers are only reused once it has
+            completed, the caller's buffers are handed back after it.
+            Defaults to None.
+        """
+        if pooled:
+            _pinned_pool.release(host_buffer, pending)
+        elif pending is not None:
+            pending.synchronize()
+
+    def _staged(self, call: Callable, send_data: ArrayLike, recv_data: ArrayLike, recv_significant: bool = True, in_place: bool = False, offset: int = 0, host_buffer: None | ArrayLike = None, reduction: bool = False) -> None:
+        """
+        Run a blocking MPI collective on device arrays through host buffers.
+
+        The arrays are staged through pooled pinned host buffers, for MPI
+        libraries that are not CUDA-aware. The received data may be staged
+        through a host buffer of the caller instead.
+
+        Parameters:
+        call (Callable): Runs the MPI call from the send and receive buffer
+            specifications.
+        send_data (ArrayLike): The device data to send.
+        recv_data (ArrayLike): The device buffer to receive the data, may be
+            None when it is not significant.
+        recv_significant (bool, optional): Whether the receive buffer is
+            written on this rank. If not, it is neither checked nor staged
+            and None is passed as its specification. Defaults to True.
+        in_place (bool, optional): Whether the send data lies in the receive
+            buffer, in which case only the receive buffer is staged and
+            MPI.IN_PLACE is passed. Defaults to False.
+        offset (int, optional): The byte offset of the send data in the
+            receive buffer when `in_place`. Defaults to 0.
+        host_buffer (ArrayLike, optional): The host buffer to store the
+            received data. Defaults to None.
+        reduction (bool, optional): Whether the collective reduces the
+            data. Defaults to False.
+        """
+        if not recv_significant:
+            recv_data = None
+        elif _get_module_from_array(send_data) != _get_module_from_array(recv_data):
+            raise ValueError("Send and receive data must be on the same array module.")
+
+        _check_contiguous(send_data, recv_data)
+        dtype = _mpi_dtype(send_data, reduction=reduction)
+
+        if in_place:
+            recv_buffer, pooled = self._host_buffer(recv_data, host_buffer)
+
+            # Only the send data is copied into its slot of the host buffer.
+            self._to_host(send_data, self._host_slot(recv_buffer, send_data, offset)).synchronize()
+            call(MPI.IN_PLACE, [recv_buffer, dtype])
+
+            self._release_host_buffer(recv_buffer, pooled, self._to_device(recv_buffer, recv_data))
+            return
+
+        send_buffer = _pinned_pool.acquire(send_data.shape, send_data.dtype)
+
+        self._to_host(send_data, send_buffer).synchronize()
+
+        if recv_data is None:
+            call([send_buffer, dtype], None)
+            _pinned_pool.release(send_buffer)
+            return
+
+        recv_buffer, pooled = self._host_buffer(recv_data, host_buffer)
+        call([send_buffer, dtype], [recv_buffer, dtype])
+        _pinned_pool.release(send_buffer)
+
+        # The current stream is ordered after the copy back, only the reuse
+        # of the pinned buffer has to wait for it.
+        self._release_host_buffer(recv_buffer, pooled, self._to_device(recv_buffer, recv_data))
+
+    def _host_slot(self, host_buffer: np.ndarray, send_data: ArrayLike, offset: int) -> np.ndarray:
+        """
+        Get the slot of in-place send data in the host copy of its buffer.
+
+        Parameters:
+        host_buffer (np.ndarray): The host copy of the receive buffer.
+        send_data (ArrayLike): The send data lying in the receive buffer.
+        offset (int): The byte offset of the send data in the receive buffer.
+
+        Returns:
+        np.ndarray: The flat view of the host buffer matching the send data.
+        """
+        start = offset // host_buffer.dtype.itemsize
+        return host_buffer.reshape(-1)[start:start + send_data.size]
+
+    def _waiter(self, request: MPI.Request) -> Callable[[], None]:
+        """
+        Get the function completing a pending MPI request.
+
+        The request is handed to the progress thread, if any.
+
+        Parameters:
+        request (MPI.Request): The pending request.
+
+        Returns:
+        Callable: A function waiting for the completion of the request.
+        """
+        if self._progress is None:
+            return request.Wait
+
+        self._progress.add(request)
+        return lambda: self._progress.wait(request)
+
+    def _get_nccl(self) -> "ONCCL":
+        """
+        Get the NCCL backend attached to this communicator.
+
+        It is created on first use, which must happen collectively.
+
+        Returns:
+        ONCCL: The NCCL backend.
+        """
+        if self._nccl is None:
+            self._nccl = _cached_onccl(self.comm)
+
+        return self._nccl
+
+    def _hierarchical_allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str) -> None:
+        """
+        Allreduce device arrays with NCCL within the nodes and MPI across.
+
+        The data is reduced onto the first rank of each node, those ranks
+        allreduce it over MPI, and the result is broadcasted back within the
+        nodes. All the steps are ordered on the current stream.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the reduced data.
+        op (str): The reduction operation (e.g., 'sum', 'max').
+        """
+        if self._local_nccl is None:
+            self._local_nccl = _cached_onccl(self._local_comm)
+
+        self._local_nccl.reduce(send_data, recv_data, op, root=0)
+
+        if self._leaders_comm != MPI.COMM_NULL:
+            dtype = _mpi_dtype(recv_data, reduction=True)
+            mpi_op = _mpi_op(op)
+
+            if self._cuda_aware:
+                cp.cuda.get_current_stream().synchronize()
+                self._leaders_comm.Allreduce(MPI.IN_PLACE, [recv_data, dtype], op=mpi_op)
+            else:
+                host_buffer = _pinned_pool.acquire(recv_data.shape, recv_data.dtype)
+                self._to_host(recv_data, host_buffer).synchronize()
+                self._leaders_comm.Allreduce(MPI.IN_PLACE, [host_buffer, dtype], op=mpi_op)
+                _pinned_pool.release(host_buffer, self._to_device(host_buffer, recv_data))
+
+        self._local_nccl.bcast(recv_data, root=0)
+
+    def _use_nccl(self, *arrs: ArrayLike, op: None | str | MPI.Op = None) -> bool:
+        """
+        Check whether a collective on the given arrays can run on NCCL.
+
+        Parameters:
+        arrs (ArrayLike): The arrays involved in the collective.
+        op (str | MPI.Op, optional): The reduction operation, if any. Defaults to None.
+
+        Returns:
+        bool: True if NCCL is available and supports the arrays and op.
+        """
+        nccl_avail = backend_flags["nccl_avail"]
+        if nccl_avail is None:
+            # NCCL is only loaded once a collective on device arrays needs it.
+            if not all(_is_gpu(arr) for arr in arrs):
+                return False
+            nccl_avail = _ensure_nccl()
+        if not nccl_avail:
+            return False
+        # An MPI.Op always goes through MPI.
+        if op is not None and not (isinstance(op, str) and op in _NCCL_OP_MAP):
+            return False
+
+        return all(
+            _is_gpu(arr) and arr.dtype in _NCCL_DTYPE_MAP
+            for arr in arrs
+        )
+
+    def _contiguous(self, arr: ArrayLike, role: str) -> ArrayLike:
+        """
+        Get a C-contiguous array to communicate in place of an array.
+
+        Non-contiguous arrays are replaced by a cached scratch array of the
+        same shape and dtype, so that MPI never packs them itself.
+
+        Parameters:
+        arr (ArrayLike): The array to communicate.
+        role (str): The role of the array in the call (e.g., 'send', 'recv'),
+            so that two arrays of one call get distinct scratch arrays.
+
+        Returns:
+        ArrayLike: The array itself if it is C-contiguous, a scratch array
+            otherwise. The scratch array is not filled.
+        """
+        if arr.flags["C_CONTIGUOUS"]:
+            return arr
+
+        key = (role, arr.shape, arr.dtype, _is_gpu(arr))
+        scratch = self._scratch.get(key)
+        if scratch is None:
+            if len(self._scratch) >= _SCRATCH_CACHE_SIZE:
+                # Drop the oldest entry.
+                del self._scratch[next(iter(self._scratch))]
+            scratch = _get_module_from_array(arr).empty(arr.shape, dtype=arr.dtype)
+            self._scratch[key] = scratch
+
+        return scratch
+
+    def _scatter_spec(self, send_data: ArrayLike, dtype: MPI.Datatype) -> list:
+        """
+        Get the vector buffer specification of a scatter from the root.
+
+        The send data is split along its first axis, with the first ranks
+        receiving one more row when the rows do not divide evenly.
+
+        Parameters:
+        send_data (ArrayLike): The data to scatter.
+        dtype (MPI.Datatype): The MPI datatype of the data.
+
+        Returns:
+        list: The [buffer, counts, displacements, datatype] specification.
+        """
+        comm_size = self._size
+        n_rows = send_data.shape[0]
+        row_size = send_data.size // n_rows if n_rows > 0 else 0
+
+        counts = [
+            (n_rows // comm_size + (r < n_rows % comm_size)) * row_size
+            for r in range(comm_size)
+        ]
+        displs = [0] * comm_size
+        for r in range(1, comm_size):
+            displs[r] = displs[r - 1] + counts[r - 1]
+
+        return [send_data, counts, displs, dtype]
 
     # Point-to-point communication (blocking) --------------------------------
     def send(self, data: ArrayLike, dest: int, send_buffer: None | ArrayLike = None, tag: int = 0) -> None:
@@ -33,16 +466,23 @@ class ODAMPI(OCOMM):
         send_buffer (ArrayLike, optional): The host buffer to store the data. Defaults to None.
         tag (int, optional): The message tag. Defaults to 0.
         """
+        _check_contiguous(data)
+        dtype = _mpi_dtype(data)
+
         if _get_module_from_array(data) == np:
-            self.comm.send(data, dest=dest, tag=tag)
+            self.comm.Send([data, dtype], dest=dest, tag=tag)
+        elif self._cuda_aware:
+            # CUDA-aware MPI reads the device memory directly, make sure
+            # the kernels producing it are done.
+            cp.cuda.get_current_stream().synchronize()
+            self.comm.Send([data, dtype], dest=dest, tag=tag)
         else:
-            if send_buffer is None:
-                send_buffer = np.empty_like(data)
-            if _get_module_from_array(send_buffer) != np:
-                raise ValueError("Host buffer must be on a host array.")
+            send_buffer, pooled = self._host_buffer(data, send_buffer)
+
+            self._to_host(data, send_buffer).synchronize()
+            self.comm.Send([send_buffer, dtype], dest=dest, tag=tag)
 
-            data.get(out=send_buffer)
-            self.comm.send(send_buffer, dest=dest, tag=tag)
+            self._release_host_buffer(send_buffer, pooled)
 
     def recv(self, buf: ArrayLike, source: int, recv_buffer: None | ArrayLike = None, tag: int = 0) -> None:
         """
@@ -51,81 +491,212 @@ class ODAMPI(OCOMM):
         Parameters:
         buf (ArrayLike): The buffer to receive the data.
         source (int): The rank of the source process.
+        recv_buffer (ArrayLike, optional): The host buffer to store the data. Defaults to None.
         tag (int, optional): The message tag. Defaults to 0.
         """
+        _check_contiguous(buf)
+        dtype = _mpi_dtype(buf)
+
         if _get_module_from_array(buf) == np:
-            self.comm.recv(buf, source=source, tag=tag)
+            self.comm.Recv([buf, dtype], source=source, tag=tag)
+        elif self._cuda_aware:
+            cp.cuda.get_current_stream().synchronize()
+            self.comm.Recv([buf, dtype], source=source, tag=tag)
         else:
-            if recv_buffer is None:
-                recv_buffer = np.empty_like(buf)
-            if _get_module_from_array(recv_buffer) != np:
-                raise ValueError("Host buffer must be on a host array.")
+            recv_buffer, pooled = self._host_buffer(buf, recv_buffer)
 
-            self.comm.recv(recv_buffer, source=source, tag=tag)
-            buf.set(arr=recv_buffer)
+            self.comm.Recv([recv_buffer, dtype], source=source, tag=tag)
+            copied = self._to_device(recv_buffer, buf)
+
+            self._release_host_buffer(recv_buffer, pooled, copied)
 
     # Point-to-point communication (non-blocking) -----------------------------
-    ...
+    def isend(self, data: ArrayLike, dest: int, send_buffer: None | ArrayLike = None, tag: int = 0) -> _Req:
+        """
+        Start sending data from one process to another.
+
+        The data must not be modified until the returned request has been
+        waited on.
+
+        Parameters:
+        data (ArrayLike): The data to send.
+        dest (int): The rank of the destination process.
+        send_buffer (ArrayLike, optional): The host buffer to store the data. Defaults to None.
+        tag (int, optional): The message tag. Defaults to 0.
+
+        Returns:
+        _Req: A request to wait on for completion.
+        """
+        _check_contiguous(data)
+        dtype = _mpi_dtype(data)
+
+        if _get_module_from_array(data) == np:
+            return _Req(self._waiter(self.comm.Isend([data, dtype], dest=dest, tag=tag)))
+        elif self._cuda_aware:
+            cp.cuda.get_current_stream().synchronize()
+            return _Req(self._waiter(self.comm.Isend([data, dtype], dest=dest, tag=tag)))
+
+        send_buffer, pooled = self._host_buffer(data, send_buffer)
+
+        # The send is posted at once, so that waiting on the requests in any
+        # order cannot deadlock.
+        self._to_host(data, send_buffer).synchronize()
+        wait_send = self._waiter(self.comm.Isend([send_buffer, dtype], dest=dest, tag=tag))
+
+        def _wait():
+            wait_send()
+            self._release_host_buffer(send_buffer, pooled)
+
+        return _Req(_wait)
+
+    def irecv(self, buf: ArrayLike, source: int, recv_buffer: None | ArrayLike = None, tag: int = 0) -> _Req:
+        """
+        Start receiving data from another process.
+
+        The buffer holds the received data only once the returned request
+        has been waited on.
+
+        Parameters:
+        buf (ArrayLike): The buffer to receive the data.
+        source (int): The rank of the source process.
+        recv_buffer (ArrayLike, optional): The host buffer to store the data. Defaults to None.
+        tag (int, optional): The message tag. Defaults to 0.
+
+        Returns:
+        _Req: A request to wait on for completion.
+        """
+        _check_contiguous(buf)
+        dtype = _mpi_dtype(buf)
+
+        if _get_module_from_array(buf) == np:
+            return _Req(self._waiter(self.comm.Irecv([buf, dtype], source=source, tag=tag)))
+        elif self._cuda_aware:
+            cp.cuda.get_current_stream().synchronize()
+            return _Req(self._waiter(self.comm.Irecv([buf, dtype], source=source, tag=tag)))
+
+        recv_buffer, pooled = self._host_buffer(buf, recv_buffer)
+
+        wait_recv = self._waiter(self.comm.Irecv([recv_buffer, dtype], source=source, tag=tag))
+
+        def _wait():
+            wait_recv()
+            copied = self._to_device(recv_buffer, buf)
+            self._release_host_buffer(recv_buffer, pooled, copied)
+
+        return _Req(_wait)
 
     # Collective communication (blocking) -------------------------------------
     def bcast(self, data: ArrayLike, root: int = 0, comm_buffer: None | ArrayLike = None) -> ArrayLike:
         """
         Broadcast data from one process to all others.
 
+        Non-contiguous data is broadcasted through a cached contiguous
+        scratch array.
+
         Parameters:
         data (ArrayLike): The data to broadcast.
         root (int, optional): The rank of the root process. Defaults to 0.
+        comm_buffer (ArrayLike, optional): The host buffer to store the data. Defaults to None.
 
         Returns:
         ArrayLike: The broadcasted data.
         """
+        buf = self._contiguous(data, "data")
+        if buf is not data:
+            xp = _get_module_from_array(data)
+            if root == self._rank:
+                xp.copyto(buf, data)
+            self.bcast(buf, root=root, comm_buffer=comm_buffer)
+            xp.copyto(data, buf)
+            return data
+
+        if self._use_nccl(data):
+            self._get_nccl().bcast(data, root=root)
+            return data
+
+        dtype = _mpi_dtype(data)
+
         if _get_module_from_array(data) == np:
-            self.comm.bcast(data, root=root)
+            self._mpi_bcast([data, dtype], root=root)
+        elif self._cuda_aware:
+            cp.cuda.get_current_stream().synchronize()
+            self._mpi_bcast([data, dtype], root=root)
         else:
-            if comm_buffer is None:
-                host_buffer = np.empty_like(data)
-            if _get_module_from_array(comm_buffer) != np:
-                raise ValueError("Host buffer must be on a host array.")
+            comm_buffer, pooled = self._host_buffer(data, comm_buffer)
 
-            if root == self.rank():
-                data.get(out=comm_buffer)
+            if root == self._rank:
+                self._to_host(data, comm_buffer).synchronize()
 
-            self.comm.bcast(comm_buffer, root=root)
+            self._mpi_bcast([comm_buffer, dtype], root=root)
 
-            return data.set(arr=comm_buffer)
+            copied = self._to_device(comm_buffer, data)
 
+            self._release_host_buffer(comm_buffer, pooled, copied)
+
+        return data
 
     def scatter(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0, send_buffer: None | ArrayLike = None, recv_buffer: None | ArrayLike = None) -> None:
         """
         Scatter data from one process to all others.
 
+        The send data is split along its first axis. If the number of rows
+        does not divide evenly, the first ranks receive one more row. The
+        send and receive data may live on different array modules.
+
         Parameters:
-        send_data (ArrayLike): The data to scatter.
+        send_data (ArrayLike): The data to scatter, only significant on the root.
         recv_data (ArrayLike): The buffer to receive the scattered data.
         root (int, optional): The rank of the root process. Defaults to 0.
+        send_buffer (ArrayLike, optional): The host buffer to store the send data. Defaults to None.
+        recv_buffer (ArrayLike, optional): The host buffer to store the received data. Defaults to None.
         """
-        if _get_module_from_array(send_data) != _get_module_from_array(recv_data):
-            raise ValueError("Send and receive data must be on the same array module.")
+        is_root = root == self._rank
+        if is_root:
+            _check_contiguous(send_data)
+        _check_contiguous(recv_data)
+        dtype = _mpi_dtype(recv_data)
+
+        # The send data is only significant on the root.
+        send_on_host = not is_root or _get_module_from_array(send_data) == np
+        recv_on_host = _get_module_from_array(recv_data) == np
 
-        if _get_module_from_array(send_data) == np and _get_module_from_array(recv_data) == np:
-            self.comm.scatter(send_data, recv_data, root=root)
+        if (send_on_host and recv_on_host) or self._cuda_aware:
+            if not (send_on_host and recv_on_host):
+                cp.cuda.get_current_stream().synchronize()
+            self.comm.Scatterv(
+                self._scatter_spec(send_data, dtype) if is_root else None,
+                [recv_data, dtype],
+                root=root,
+            )
+            return
+
+        # Stage only the side(s) living on the device.
+        if send_on_host:
+            send_buffer = send_data
         else:
-            if send_buffer is None:
-                send_buffer = np.empty_like(send_data)
-            if _get_module_from_array(send_buffer) != np:
-                raise ValueError("Host buffer must be on a host array.")
-            if recv_buffer is None:
-                recv_buffer = np.empty_like(recv_data)
-            if _get_module_from_array(recv_buffer) != np:
-                raise ValueError("Host buffer must be on a host array.")
+            send_buffer, send_pooled = self._host_buffer(send_data, send_buffer)
+
+            self._to_host(send_data, send_buffer).synchronize()
 
-            if root == self.rank():
-                send_data.get(out=send_buffer)
+        if recv_on_host:
+            recv_buffer = recv_data
+        else:
+            recv_buffer, recv_pooled = self._host_buffer(recv_data, recv_buffer)
 
-            self.comm.scatter(send_data, recv_data, root=root)
+        self.comm.Scatterv(
+            self._scatter_spec(send_buffer, dtype) if is_root else None,
+            [recv_buffer, dtype],
+            root=root,
+        )
 
-            recv_data.set(arr=recv_buffer)
+        copied = None
+        if not recv_on_host:
+            copied = self._to_device(recv_buffer, recv_data)
 
+        if not send_on_host:
+            self._release_host_buffer(send_buffer, send_pooled)
+        if not recv_on_host:
+            self._release_host_buffer(recv_buffer, recv_pooled, copied)
 
     def gather(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0, host_buffer: None | ArrayLike = None) -> None:
         """
@@ -133,10 +704,26 @@ class ODAMPI(OCOMM):
 
         Parameters:
         send_data (ArrayLike): The data to send.
-        recv_data (ArrayLike): The buffer to receive the gathered data.
+        recv_data (ArrayLike): The buffer to receive the gathered data, only
+            significant on the root, may be None elsewhere.
         root (int, optional): The rank of the root process. Defaults to 0.
+        host_buffer (ArrayLike, optional): The host buffer to store the
+            received data when device data is staged. Defaults to None.
         """
-        self.comm.gather(send_data, recv_data, root=root)
+        if _is_gpu(send_data) and not self._cuda_aware:
+            self._staged(
+                lambda send_spec, recv_spec: self.comm.Gather(send_spec, recv_spec, root=root),
+                send_data,
+                recv_data,
+                recv_significant=root == self._rank,
+                host_buffer=host_buffer,
+            )
+            return
+
+        if self._cuda_aware and _is_gpu(send_data):
+            cp.cuda.get_current_stream().synchronize()
+
+        self.comm.Gather(send_data, recv_data, root=root)
 
     def allgather(self, send_data: ArrayLike, recv_data: ArrayLike, host_buffer: None | ArrayLike = None) -> None:
         """
@@ -145,7 +732,30 @@ class ODAMPI(OCOMM):
         Parameters:
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the gathered data.
+        host_buffer (ArrayLike, optional): The host buffer to store the
+            received data when device data is staged. Defaults to None.
         """
+        _check_contiguous(send_data, recv_data)
+
+        if self._use_nccl(send_data, recv_data):
+            self._get_nccl().allgather(send_data, recv_data)
+            return
+
+        # When the send data already is this rank's block of the receive
+        # buffer, MPI can skip the local copy.
+        offset = self._rank * send_data.nbytes
+        in_place = _is_in_place(send_data, recv_data, offset=offset)
+
+        if _is_gpu(send_data) and not self._cuda_aware:
+            self._staged(self.comm.Allgather, send_data, recv_data, in_place=in_place, offset=offset, host_buffer=host_buffer)
+            return
+
+        if self._cuda_aware and _is_gpu(send_data):
+            cp.cuda.get_current_stream().synchronize()
+
+        if in_place:
+            send_data = MPI.IN_PLACE
+
         self.comm.Allgather(send_data, recv_data)
 
     def reduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, root: int = 0, host_buffer: None | ArrayLike = None) -> None:
@@ -154,22 +764,213 @@ class ODAMPI(OCOMM):
 
         Parameters:
         send_data (ArrayLike): The data to send.
-        recv_data (ArrayLike): The buffer to receive the reduced data.
+        recv_data (ArrayLike): The buffer to receive the reduced data, only
+            significant on the root, may be None elsewhere.
         op (str): The reduction operation (e.g., 'sum', 'max').
         root (int, optional): The rank of the root process. Defaults to 0.
+        host_buffer (ArrayLike, optional): The host buffer to store the
+            received data when device data is staged. Defaults to None.
         """
-        self.comm.Reduce(send_data, recv_data, op=MPI.__dict__[op.upper()], root=root)
+        _check_contiguous(send_data, recv_data)
+
+        # The receive buffer may be None off the root, the choice of backend
+        # must not depend on it.
+        if self._use_nccl(send_data, op=op):
+            self._get_nccl().reduce(send_data, recv_data, op, root=root)
+            return
 
-    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, host_buffer: None | ArrayLike = None) -> None:
+        # The send buffer is only replaced on the root, the other ranks still
+        # contribute their data.
+        in_place = root == self._rank and _is_in_place(send_data, recv_data)
+
+        if _is_gpu(send_data) and not self._cuda_aware:
+            mpi_op = _mpi_op(op)
+            self._staged(
+                lambda send_spec, recv_spec: self.comm.Reduce(send_spec, recv_spec, op=mpi_op, root=root),
+                send_data,
+                recv_data,
+                recv_significant=root == self._rank,
+                in_place=in_place,
+                host_buffer=host_buffer,
+                reduction=True,
+            )
+            return
+
+        if self._cuda_aware and _is_gpu(send_data):
+            cp.cuda.get_current_stream().synchronize()
+
+        if in_place:
+            send_data = MPI.IN_PLACE
+
+        self.comm.Reduce(send_data, recv_data, op=_mpi_op(op), root=root)
+
+    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, host_buffer: None | ArrayLike = None, async_op: bool = False) -> None | _Req:
         """
         Reduce data from all processes to all.
 
+        Non-contiguous data is reduced through cached contiguous scratch
+        arrays.
+
         Parameters:
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the reduced data.
         op (str): The reduction operation (e.g., 'sum', 'max').
+        host_buffer (ArrayLike, optional): The host buffer to store the
+            received data when device data is staged. Defaults to None.
+        async_op (bool, optional): If True, return without waiting for the
+            reduction to complete, as `iallreduce`. Such calls are not
+            coalesced. Defaults to False.
+
+        Returns:
+        None | _Req: With `async_op`, a request to wait on for completion.
+        """
+        if async_op:
+            return self.iallreduce(send_data, recv_data, op)
+
+        if self._coalescing:
+            # A call reading or writing a pending receive buffer, or writing a
+            # pending send buffer, must see the recorded calls performed.
+            if any(
+                _may_share_memory(send_data, pending_recv)
+                or _may_share_memory(recv_data, pending_recv)
+                or _may_share_memory(recv_data, pending_send)
+                for pending_send, pending_recv, _ in self._pending_allreduce
+            ):
+                self._coalescing = False
+                pending, self._pending_allreduce = self._pending_allreduce, []
+                self._flush_allreduce(pending)
+                self._coalescing = True
+
+            self._pending_allreduce.append((send_data, recv_data, op))
+            return
+
+        if not (send_data.flags["C_CONTIGUOUS"] and recv_data.flags["C_CONTIGUOUS"]):
+            # Reduce through contiguous scratch arrays, keeping the aliasing
+            # of in-place calls.
+            xp = _get_module_from_array(recv_data)
+            recv_buf = self._contiguous(recv_data, "recv")
+            send_buf = recv_buf if send_data is recv_data else self._contiguous(send_data, "send")
+            if send_buf is not send_data:
+                xp.copyto(send_buf, send_data)
+            self.allreduce(send_buf, recv_buf, op, host_buffer=host_buffer)
+            if recv_buf is not recv_data:
+                xp.copyto(recv_data, recv_buf)
+            return
+
+        # Fast path for plain host arrays, skipping the device dispatch.
+        if send_data.__class__ is np.ndarray:
+            if _is_in_place(send_data, recv_data):
+                send_data = MPI.IN_PLACE
+            self._mpi_allreduce(send_data, recv_data, op=_mpi_op(op))
+            return
+
+        if self._use_nccl(send_data, recv_data, op=op):
+            if self._hierarchical:
+                self._hierarchical_allreduce(send_data, recv_data, op)
+            else:
+                self._get_nccl().allreduce(send_data, recv_data, op)
+            return
+
+        in_place = _is_in_place(send_data, recv_data)
+
+        if _is_gpu(send_data) and not self._cuda_aware:
+            mpi_op = _mpi_op(op)
+            self._staged(
+                lambda send_spec, recv_spec: self._mpi_allreduce(send_spec, recv_spec, op=mpi_op),
+                send_data,
+                recv_data,
+                in_place=in_place,
+                host_buffer=host_buffer,
+                reduction=True,
+            )
+            return
+
+        if self._cuda_aware and _is_gpu(recv_data):
+            # One sync right before MPI reads the device memory.
+            cp.cuda.get_current_stream().synchronize()
+
+        if in_place:
+            send_data = MPI.IN_PLACE
+
+        self._mpi_allreduce(send_data, recv_data, op=_mpi_op(op))
+
+    @contextmanager
+    def coalesce(self):
+        """
+        Batch the allreduce calls issued within the context.
+
+        Inside the context, `allreduce` only records its buffers. On exit,
+        the recorded payloads are concatenated and reduced with a single
+        allreduce per (op, dtype, array module) group, and the results are
+        copied back into the receive buffers. A call whose buffers overlap
+        the receive buffer of a recorded call, or whose receive buffer
+        overlaps a recorded send buffer, first performs the calls recorded
+        so far. The receive buffers must not be read before the context
+        exits, and every rank must record the same sequence of calls.
+        """
+        self.group_start()
+        try:
+            yield self
+        except BaseException:
+            # The recorded calls are dropped, not performed.
+            self._coalescing = False
+            self._pending_allreduce = []
+            raise
+
+        self.group_end()
+
+    def group_start(self) -> None:
+        """
+        Start recording the following allreduce calls, see `coalesce`.
+        """
+        self._coalescing = True
+
+    def group_end(self) -> None:
+        """
+        Perform the allreduce calls recorded since `group_start`.
+        """
+        self._coalescing = False
+        pending, self._pending_allreduce = self._pending_allreduce, []
+
+        self._flush_allreduce(pending)
+
+    def group(self):
+        """
+        Group the allreduce calls issued within the context, see `coalesce`.
         """
-        self.comm.Allreduce(send_data, recv_data, op=MPI.__dict__[op.upper()])
+        return self.coalesce()
+
+    def _flush_allreduce(self, pending: list[tuple[ArrayLike, ArrayLike, str]]) -> None:
+        """
+        Perform the allreduce calls recorded by `coalesce`.
+
+        Parameters:
+        pending (list): The recorded (send_data, recv_data, op) triplets.
+        """
+        groups: dict[tuple, tuple[str | MPI.Op, list[tuple[ArrayLike, ArrayLike]]]] = {}
+        for send_data, recv_data, op in pending:
+            # Predefined MPI.Op objects are singletons, their id is enough.
+            key = (op if isinstance(op, str) else id(op), send_data.dtype, _is_gpu(send_data))
+            groups.setdefault(key, (op, []))[1].append((send_data, recv_data))
+
+        for op, group in groups.values():
+            if len(group) == 1:
+                self.allreduce(*group[0], op)
+                continue
+
+            xp = _get_module_from_array(group[0][0])
+            send_scratch = xp.concatenate([send_data.reshape(-1) for send_data, _ in group])
+            recv_scratch = xp.empty_like(send_scratch)
+
+            self.allreduce(send_scratch, recv_scratch, op)
+
+            offset = 0
+            for _, recv_data in group:
+                xp.copyto(
+                    recv_data,
+                    recv_scratch[offset:offset + recv_data.size].reshape(recv_data.shape),
+                )
+                offset += recv_data.size
 
     def alltoall(self, send_data: ArrayLike, recv_data: ArrayLike, host_buffer: None | ArrayLike = None) -> None:
         """
@@ -178,18 +979,323 @@ class ODAMPI(OCOMM):
         Parameters:
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the data.
+        host_buffer (ArrayLike, optional): The host buffer to store the
+            received data when device data is staged. Defaults to None.
         """
+        if _is_gpu(send_data) and not self._cuda_aware:
+            self._staged(self.comm.Alltoall, send_data, recv_data, host_buffer=host_buffer)
+            return
+
+        if self._cuda_aware and _is_gpu(send_data):
+            cp.cuda.get_current_stream().synchronize()
+
         self.comm.Alltoall(send_data, recv_data)
 
     # Collective communication (non-blocking) ---------------------------------
-        ...
+    def _nonblocking(self, start: Callable, send_data: ArrayLike, recv_data: ArrayLike, in_place: bool = False, offset: int = 0, reduction: bool = False) -> _Req:
+        """
+        Run a non-blocking MPI collective.
+
+        Device arrays are handed to MPI directly when it is CUDA-aware, and
+        otherwise staged through pooled pinned host buffers.
+
+        Parameters:
+        start (Callable): Posts the MPI call from the send and receive buffer
+            specifications and returns the MPI request.
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the data.
+        in_place (bool, optional): Whether the send data lies in the receive
+            buffer, in which case MPI.IN_PLACE is passed. Defaults to False.
+        offset (int, optional): The byte offset of the send data in the
+            receive buffer when `in_place`. Defaults to 0.
+        reduction (bool, optional): Whether the collective reduces the
+            data. Defaults to False.
+
+        Returns:
+        _Req: A request to wait on for completion.
+        """
+        if _get_module_from_array(send_data) != _get_module_from_array(recv_data):
+            raise ValueError("Send and receive data must be on the same array module.")
+
+        _check_contiguous(send_data, recv_data)
+        dtype = _mpi_dtype(send_data, reduction=reduction)
+        send_spec = MPI.IN_PLACE if in_place else [send_data, dtype]
+
+        if not _is_gpu(send_data):
+            return _Req(self._waiter(start(send_spec, [recv_data, dtype])))
+        elif self._cuda_aware:
+            cp.cuda.get_current_stream().synchronize()
+            return _Req(self._waiter(start(send_spec, [recv_data, dtype])))
+
+        if in_place:
+            recv_buffer = _pinned_pool.acquire(recv_data.shape, recv_data.dtype)
+
+            self._to_host(send_data, self._host_slot(recv_buffer, send_data, offset)).synchronize()
+            wait_mpi = self._waiter(start(MPI.IN_PLACE, [recv_buffer, dtype]))
+
+            def _wait():
+                wait_mpi()
+                _pinned_pool.release(recv_buffer, self._to_device(recv_buffer, recv_data))
+
+            return _Req(_wait)
+
+        send_buffer = _pinned_pool.acquire(send_data.shape, send_data.dtype)
+        recv_buffer = _pinned_pool.acquire(recv_data.shape, recv_data.dtype)
+
+        self._to_host(send_data, send_buffer).synchronize()
+        wait_mpi = self._waiter(start([send_buffer, dtype], [recv_buffer, dtype]))
+
+        def _wait():
+            wait_mpi()
+            _pinned_pool.release(send_buffer)
+            _pinned_pool.release(recv_buffer, self._to_device(recv_buffer, recv_data))
+
+        return _Req(_wait)
+
+    def ibcast(self, data: ArrayLike, root: int = 0) -> _Req:
+        """
+        Start broadcasting data from one process to all others.
+
+        The data holds the broadcasted values only once the returned request
+        has been waited on.
+
+        Parameters:
+        data (ArrayLike): The data to broadcast.
+        root (int, optional): The rank of the root process. Defaults to 0.
+
+        Returns:
+        _Req: A request to wait on for completion.
+        """
+        _check_contiguous(data)
+
+        if self._use_nccl(data):
+            stream = cp.cuda.get_current_stream()
+            self._get_nccl().bcast(data, root=root)
+            return _Req(stream.record().synchronize)
+
+        dtype = _mpi_dtype(data)
+
+        if not _is_gpu(data):
+            return _Req(self._waiter(self.comm.Ibcast([data, dtype], root=root)))
+        elif self._cuda_aware:
+            cp.cuda.get_current_stream().synchronize()
+            return _Req(self._waiter(self.comm.Ibcast([data, dtype], root=root)))
+
+        comm_buffer = _pinned_pool.acquire(data.shape, data.dtype)
+        if root == self._rank:
+            self._to_host(data, comm_buffer).synchronize()
+
+        wait_mpi = self._waiter(self.comm.Ibcast([comm_buffer, dtype], root=root))
+
+        def _wait():
+            wait_mpi()
+            _pinned_pool.release(comm_buffer, self._to_device(comm_buffer, data))
+
+        return _Req(_wait)
+
+    def iallgather(self, send_data: ArrayLike, recv_data: ArrayLike) -> _Req:
+        """
+        Start gathering data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the gathered data.
+
+        Returns:
+        _Req: A request to wait on for completion.
+        """
+        _check_contiguous(send_data, recv_data)
+
+        if self._use_nccl(send_data, recv_data):
+            stream = cp.cuda.get_current_stream()
+            self._get_nccl().allgather(send_data, recv_data)
+            return _Req(stream.record().synchronize)
+
+        offset = self._rank * send_data.nbytes
+        in_place = _is_in_place(send_data, recv_data, offset=offset)
+
+        return self._nonblocking(self.comm.Iallgather, send_data, recv_data, in_place=in_place, offset=offset)
+
+    def iallreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str) -> _Req:
+        """
+        Start reducing data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the reduced data.
+        op (str): The reduction operation (e.g., 'sum', 'max').
+
+        Returns:
+        _Req: A request to wait on for completion.
+        """
+        _check_contiguous(send_data, recv_data)
+
+        if self._use_nccl(send_data, recv_data, op=op):
+            stream = cp.cuda.get_current_stream()
+            self._get_nccl().allreduce(send_data, recv_data, op)
+            return _Req(stream.record().synchronize)
+
+        mpi_op = _mpi_op(op)
+        return self._nonblocking(
+            lambda send_spec, recv_spec: self.comm.Iallreduce(send_spec, recv_spec, op=mpi_op),
+            send_data,
+            recv_data,
+            in_place=_is_in_place(send_data, recv_data),
+            reduction=True,
+        )
+
+    def ialltoall(self, send_data: ArrayLike, recv_data: ArrayLike) -> _Req:
+        """
+        Start sending data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the data.
+
+        Returns:
+        _Req: A request to wait on for completion.
+        """
+        return self._nonblocking(self.comm.Ialltoall, send_data, recv_data)
+
+    def _persistent(self, init, send_data: ArrayLike, recv_data: ArrayLike, in_place: bool = False, offset: int = 0, reduction: bool = False, **kwargs) -> _PersistentReq:
+        """
+        Build a persistent collective from an MPI `*_init` call.
+
+        Device arrays are handed to MPI directly when it is CUDA-aware, and
+        otherwise staged through pinned host buffers owned by the request.
+
+        Parameters:
+        init (Callable): The bound MPI `*_init` method.
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the data.
+        in_place (bool, optional): Whether the send data lies in the receive
+            buffer, in which case MPI.IN_PLACE is passed. Defaults to False.
+        offset (int, optional): The byte offset of the send data in the
+            receive buffer when `in_place`. Defaults to 0.
+        reduction (bool, optional): Whether the collective reduces the
+            data. Defaults to False.
+        kwargs: Extra arguments of the `*_init` method.
+
+        Returns:
+        _PersistentReq: The persistent request.
+        """
+        if _get_module_from_array(send_data) != _get_module_from_array(recv_data):
+            raise ValueError("Send and receive data must be on the same array module.")
+
+        _check_contiguous(send_data, recv_data)
+        dtype = _mpi_dtype(send_data, reduction=reduction)
+        send_spec = MPI.IN_PLACE if in_place else [send_data, dtype]
+
+        if not _is_gpu(send_data):
+            return _PersistentReq(init(send_spec, [recv_data, dtype], **kwargs))
+        elif self._cuda_aware:
+            return _PersistentReq(
+                init(send_spec, [recv_data, dtype], **kwargs),
+                pre_start=lambda: cp.cuda.get_current_stream().synchronize(),
+            )
+
+        if in_place:
+            recv_buffer = _pinned_pool.acquire(recv_data.shape, recv_data.dtype)
+            slot = self._host_slot(recv_buffer, send_data, offset)
+
+            return _PersistentReq(
+                init(MPI.IN_PLACE, [recv_buffer, dtype], **kwargs),
+                pre_start=lambda: self._to_host(send_data, slot).synchronize(),
+                post_wait=lambda: self._to_device(recv_buffer, recv_data).synchronize(),
+            )
+
+        send_buffer = _pinned_pool.acquire(send_data.shape, send_data.dtype)
+        recv_buffer = _pinned_pool.acquire(recv_data.shape, recv_data.dtype)
+
+        return _PersistentReq(
+            init([send_buffer, dtype], [recv_buffer, dtype], **kwargs),
+            pre_start=lambda: self._to_host(send_data, send_buffer).synchronize(),
+            post_wait=lambda: self._to_device(recv_buffer, recv_data).synchronize(),
+        )
+
+    def persistent_allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str) -> _PersistentReq:
+        """
+        Create a persistent allreduce on fixed buffers.
+
+        The returned request is started and waited on once per reduction,
+        which skips the MPI setup of each call. The buffers must not be
+        reallocated between starts. Requires an MPI-4 library.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the reduced data.
+        op (str): The reduction operation (e.g., 'sum', 'max').
+
+        Returns:
+        _PersistentReq: The persistent request.
+        """
+        return self._persistent(
+            self.comm.Allreduce_init,
+            send_data,
+            recv_data,
+            in_place=_is_in_place(send_data, recv_data),
+            reduction=True,
+            op=_mpi_op(op),
+        )
+
+    def persistent_allgather(self, send_data: ArrayLike, recv_data: ArrayLike) -> _PersistentReq:
+        """
+        Create a persistent allgather on fixed buffers.
+
+        The buffers must not be reallocated between starts. Requires an
+        MPI-4 library.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the gathered data.
+
+        Returns:
+        _PersistentReq: The persistent request.
+        """
+        offset = self._rank * send_data.nbytes
+        in_place = _is_in_place(send_data, recv_data, offset=offset)
+
+        return self._persistent(self.comm.Allgather_init, send_data, recv_data, in_place=in_place, offset=offset)
+
+    def persistent_bcast(self, data: ArrayLike, root: int = 0) -> _PersistentReq:
+        """
+        Create a persistent broadcast on a fixed buffer.
+
+        The buffer must not be reallocated between starts. Requires an
+        MPI-4 library.
+
+        Parameters:
+        data (ArrayLike): The data to broadcast.
+        root (int, optional): The rank of the root process. Defaults to 0.
+
+        Returns:
+        _PersistentReq: The persistent request.
+        """
+        _check_contiguous(data)
+        dtype = _mpi_dtype(data)
+
+        if not _is_gpu(data):
+            return _PersistentReq(self.comm.Bcast_init([data, dtype], root=root))
+        elif self._cuda_aware:
+            return _PersistentReq(
+                self.comm.Bcast_init([data, dtype], root=root),
+                pre_start=lambda: cp.cuda.get_current_stream().synchronize(),
+            )
+
+        comm_buffer = _pinned_pool.acquire(data.shape, data.dtype)
+
+        return _PersistentReq(
+            self.comm.Bcast_init([comm_buffer, dtype], root=root),
+            pre_start=(lambda: self._to_host(data, comm_buffer).synchronize()) if root == self._rank else None,
+            post_wait=lambda: self._to_device(comm_buffer, data).synchronize(),
+        )
 
     # Synchronization ---------------------------------------------------------
     def barrier(self) -> None:
         """
         Synchronize all processes.
         """
-        self.comm.Barrier()
+        self._mpi_barrier()
 
     # Communicators -----------------------------------------------------------
     def split(self, color: int, key: int) -> 'OCOMM':
@@ -203,7 +1309,7 @@ class ODAMPI(OCOMM):
         Returns:
         Communicator: A new communicator.
         """
-        return OMPI(self.comm.Split(color, key))
+        return ODAMPI(self.comm.Split(color, key))
 
     def dup(self) -> 'OCOMM':
         """
@@ -212,7 +1318,7 @@ class ODAMPI(OCOMM):
         Returns:
         Communicator: A new communicator.
         """
-        return OMPI(self.comm.Dup())
+        return ODAMPI(self.comm.Dup())
 
     # Process management -------------------------------------------------------
     def rank(self) -> int:
@@ -222,7 +1328,7 @@ class ODAMPI(OCOMM):
         Returns:
         int: The rank of the process.
         """
-        return self.comm.Get_rank()
+        return self._rank
 
     def size(self) -> int:
         """
@@ -231,4 +1337,4 @@ class ODAMPI(OCOMM):
         Returns:
         int: The size of the communicator.
         """
-        return self.comm.Get_size()
\ No newline at end of file
+        return self._size
\ No newline at end of file
@@ -0,0 +1,97 @@
+# Copyright 2023-2024 ETH Zurich and Quantum Transport Toolbox authors.
+
+from collections import OrderedDict
+from math import prod
+
+from pyocomm import backend_flags
+
+import numpy as np
+
+if backend_flags["cupy_avail"]:
+    import cupy as cp
+
+# Maximum number of (nbytes, dtype) buckets kept, the least recently used
+# one is dropped first.
+_POOL_MAXSIZE = 32
+
+# Maximum number of free buffers kept per bucket.
+_POOL_DEPTH = 4
+
+
+class _PinnedPool:
+    """Pool of pinned host buffers used to stage device arrays.
+
+    Free buffers are bucketed by (nbytes, dtype), with a bounded number of
+    buckets evicted in least recently used order. Each free buffer comes
+    with the event of the last copy still reading it, if any.
+
+    Parameters:
+    maxsize (int, optional): The maximum number of buckets. Defaults to 32.
+    depth (int, optional): The maximum number of free buffers per bucket.
+        Defaults to 4.
+    """
+    def __init__(self, maxsize: int = _POOL_MAXSIZE, depth: int = _POOL_DEPTH):
+        self._maxsize = maxsize
+        self._depth = depth
+        self._buckets: OrderedDict[tuple[int, np.dtype], list[tuple[np.ndarray, "None | cp.cuda.Event"]]] = OrderedDict()
+
+    def acquire(self, shape: tuple, dtype: np.dtype) -> np.ndarray:
+        """
+        Get a pinned host buffer from the pool, allocating it if needed.
+
+        Parameters:
+        shape (tuple): The shape of the buffer.
+        dtype (np.dtype): The dtype of the buffer.
+
+        Returns:
+        np.ndarray: A pinned host buffer of the requested shape and dtype.
+        """
+        dtype = np.dtype(dtype)
+        count = prod(shape)
+        key = (count * dtype.itemsize, dtype)
+
+        free_list = self._buckets.get(key)
+        if free_list:
+            self._buckets.move_to_end(key)
+            buf, pending = free_list.pop()
+            if pending is not None:
+                pending.synchronize()
+        else:
+            mem = cp.cuda.alloc_pinned_memory(count * dtype.itemsize)
+            buf = np.frombuffer(mem, dtype=dtype, count=count)
+
+        return buf.reshape(shape)
+
+    def release(self, buf: np.ndarray, pending: "None | cp.cuda.Event" = None) -> None:
+        """
+        Give a pinned host buffer back to the pool.
+
+        Parameters:
+        buf (np.ndarray): A buffer obtained from `acquire`.
+        pending (cp.cuda.Event, optional): The event of a queued copy still
+            reading the buffer. The buffer is only handed out again once it
+            has completed. Defaults to None.
+        """
+        key = (buf.nbytes, buf.dtype)
+
+        free_list = self._buckets.get(key)
+        if free_list is None:
+            free_list = self._buckets[key] = []
+            if len(self._buckets) > self._maxsize:
+                _, evicted = self._buckets.popitem(last=False)
+                # The memory goes back to CuPy's pinned pool, where it can be
+                # reused at once.
+                for _, evicted_pending in evicted:
+                    if evicted_pending is not None:
+                        evicted_pending.synchronize()
+        else:
+            self._buckets.move_to_end(key)
+
+        if len(free_list) < self._depth:
+            free_list.append((buf.reshape(-1), pending))
+        elif pending is not None:
+            pending.synchronize()
+
+
+# Shared by all the ODAMPI communicators of the process.
+_pinned_pool = _PinnedPool()
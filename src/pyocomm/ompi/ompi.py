@@ -1,19 +1,32 @@
+from __future__ import annotations
 
 from numpy.typing import ArrayLike
 
 from pyocomm import OCOMM, backend_flags
+from pyocomm.core.mpi_utils import _check_contiguous, _is_in_place, _mpi_op
 
 if backend_flags["mpi_avail"]:
     from mpi4py import MPI
 
+
 class OMPI(OCOMM):
     """Oblivious MPI communicator."""
     def __init__(
             self,
-            comm : MPI.Comm = MPI.COMM_WORLD,
+            comm : None | MPI.Comm = None,
         ):
         
+        if comm is None:
+            comm = MPI.COMM_WORLD
+
         self.comm = comm
+        self._rank = comm.Get_rank()
+        self._size = comm.Get_size()
+
+        # Bound once, the hot collectives then skip the attribute lookups.
+        self._mpi_allreduce = comm.Allreduce
+        self._mpi_bcast = comm.Bcast
+        self._mpi_barrier = comm.Barrier
 
     # Point-to-point communication (blocking) --------------------------------
     def send(self, data: ArrayLike, dest: int, tag: int = 0) -> None:
@@ -25,7 +38,8 @@ class OMPI(OCOMM):
         dest (int): The rank of the destination process.
         tag (int, optional): The message tag. Defaults to 0.
         """
-        self.comm.send(data, dest=dest, tag=tag)
+        _check_contiguous(data)
+        self.comm.Send(data, dest=dest, tag=tag)
 
     def recv(self, buf: ArrayLike, source: int, tag: int = 0) -> None:
         """
@@ -36,7 +50,8 @@ class OMPI(OCOMM):
         source (int): The rank of the source process.
         tag (int, optional): The message tag. Defaults to 0.
         """
-        self.comm.recv(buf, source=source, tag=tag)
+        _check_contiguous(buf)
+        self.comm.Recv(buf, source=source, tag=tag)
 
     # Point-to-point communication (non-blocking) -----------------------------
     ...
@@ -53,7 +68,7 @@ class OMPI(OCOMM):
         Returns:
         ArrayLike: The broadcasted data.
         """
-        self.comm.bcast(data, root=root)
+        self._mpi_bcast(data, root=root)
         return data
 
     def scatter(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0) -> None:
@@ -86,6 +101,9 @@ class OMPI(OCOMM):
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the gathered data.
         """
+        if _is_in_place(send_data, recv_data, offset=self._rank * send_data.nbytes):
+            send_data = MPI.IN_PLACE
+
         self.comm.Allgather(send_data, recv_data)
 
     def reduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, root: int = 0) -> None:
@@ -98,9 +116,13 @@ class OMPI(OCOMM):
         op (str): The reduction operation (e.g., 'sum', 'max').
         root (int, optional): The rank of the root process. Defaults to 0.
         """
-        self.comm.Reduce(send_data, recv_data, op=MPI.__dict__[op.upper()], root=root)
+        # Only the root can reduce in place.
+        if root == self._rank and _is_in_place(send_data, recv_data):
+            send_data = MPI.IN_PLACE
+
+        self.comm.Reduce(send_data, recv_data, op=_mpi_op(op), root=root)
 
-    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str) -> None:
+    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, async_op: bool = False) -> None | MPI.Request:
         """
         Reduce data from all processes to all.
 
@@ -108,8 +130,19 @@ class OMPI(OCOMM):
         send_data (ArrayLike): The data to send.
         recv_data (ArrayLike): The buffer to receive the reduced data.
         op (str): The reduction operation (e.g., 'sum', 'max').
+        async_op (bool, optional): If True, return without waiting for the
+            reduction to complete. Defaults to False.
+
+        Returns:
+        None | MPI.Request: With `async_op`, the request of the reduction.
         """
-        self.comm.Allreduce(send_data, recv_data, op=MPI.__dict__[op.upper()])
+        if async_op:
+            return self.iallreduce(send_data, recv_data, op)
+
+        if _is_in_place(send_data, recv_data):
+            send_data = MPI.IN_PLACE
+
+        self._mpi_allreduce(send_data, recv_data, op=_mpi_op(op))
 
     def alltoall(self, send_data: ArrayLike, recv_data: ArrayLike) -> None:
         """
@@ -122,14 +155,71 @@ class OMPI(OCOMM):
         self.comm.Alltoall(send_data, recv_data)
 
     # Collective communication (non-blocking) ---------------------------------
-        ...
+    def ibcast(self, data: ArrayLike, root: int = 0) -> MPI.Request:
+        """
+        Start broadcasting data from one process to all others.
+
+        Parameters:
+        data (ArrayLike): The data to broadcast.
+        root (int, optional): The rank of the root process. Defaults to 0.
+
+        Returns:
+        MPI.Request: A request to wait on for completion.
+        """
+        return self.comm.Ibcast(data, root=root)
+
+    def iallgather(self, send_data: ArrayLike, recv_data: ArrayLike) -> MPI.Request:
+        """
+        Start gathering data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the gathered data.
+
+        Returns:
+        MPI.Request: A request to wait on for completion.
+        """
+        if _is_in_place(send_data, recv_data, offset=self._rank * send_data.nbytes):
+            send_data = MPI.IN_PLACE
+
+        return self.comm.Iallgather(send_data, recv_data)
+
+    def iallreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str) -> MPI.Request:
+        """
+        Start reducing data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the reduced data.
+        op (str): The reduction operation (e.g., 'sum', 'max').
+
+        Returns:
+        MPI.Request: A request to wait on for completion.
+        """
+        if _is_in_place(send_data, recv_data):
+            send_data = MPI.IN_PLACE
+
+        return self.comm.Iallreduce(send_data, recv_data, op=_mpi_op(op))
+
+    def ialltoall(self, send_data: ArrayLike, recv_data: ArrayLike) -> MPI.Request:
+        """
+        Start sending data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the data.
+
+        Returns:
+        MPI.Request: A request to wait on for completion.
+        """
+        return self.comm.Ialltoall(send_data, recv_data)
 
     # Synchronization ---------------------------------------------------------
     def barrier(self) -> None:
         """
         Synchronize all processes.
         """
-        self.comm.Barrier()
+        self._mpi_barrier()
 
     # Communicators -----------------------------------------------------------
     def split(self, color: int, key: int) -> 'OCOMM':
@@ -162,7 +252,7 @@ class OMPI(OCOMM):
         Returns:
         int: The rank of the process.
         """
-        return self.comm.Get_rank()
+        return self._rank
 
     def size(self) -> int:
         """
@@ -171,4 +261,4 @@ class OMPI(OCOMM):
         Returns:
         int: The size of the communicator.
         """
-        return self.comm.Get_size()
\ No newline at end of file
+        return self._size
\ No newline at end of file
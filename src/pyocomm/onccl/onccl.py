@@ -1,4 +1,503 @@
-from pyocomm import OCOMM
+from __future__ import annotations
+
+from warnings import warn
+
+from numpy.typing import ArrayLike
+
+from pyocomm import OCOMM, backend_flags
+from pyocomm.core.handles import _Req
+
+import numpy as np
+
+if backend_flags["mpi_avail"]:
+    from mpi4py import MPI
+
+if backend_flags["cupy_avail"]:
+    import cupy as cp
+
+# Filled by `_ensure_nccl`, NCCL is only loaded on first use.
+_NCCL_DTYPE_MAP: dict = {}
+_NCCL_OP_MAP: dict = {}
+
+# Depth of the open `group_start` calls. NCCL groups are per thread, not per
+# communicator, and defer the launch of the grouped operations.
+_group_depth = 0
+
+
+def _ensure_nccl() -> bool:
+    """
+    Load NCCL on first use and record whether it is available.
+
+    The outcome is stored in `backend_flags["nccl_avail"]`, which is None
+    until then.
+
+    Returns:
+    bool: True if NCCL is available.
+    """
+    global nccl
+
+    if backend_flags["nccl_avail"] is None:
+        try:
+            from cupy.cuda import nccl
+            # Raises if the NCCL library cannot be loaded.
+            nccl.get_version()
+            backend_flags["nccl_avail"] = bool(nccl.available)
+        except Exception as e:
+            warn(f"NCCL is not available. ({e})")
+            backend_flags["nccl_avail"] = False
+
+        if backend_flags["nccl_avail"]:
+            _NCCL_DTYPE_MAP.update({
+                np.dtype(np.int8): nccl.NCCL_INT8,
+                np.dtype(np.int32): nccl.NCCL_INT32,
+                np.dtype(np.int64): nccl.NCCL_INT64,
+                np.dtype(np.uint8): nccl.NCCL_UINT8,
+                np.dtype(np.uint32): nccl.NCCL_UINT32,
+                np.dtype(np.uint64): nccl.NCCL_UINT64,
+                np.dtype(np.float16): nccl.NCCL_FLOAT16,
+                np.dtype(np.float32): nccl.NCCL_FLOAT32,
+                np.dtype(np.float64): nccl.NCCL_FLOAT64,
+            })
+            _NCCL_OP_MAP.update({
+                "sum": nccl.NCCL_SUM,
+                "prod": nccl.NCCL_PROD,
+                "max": nccl.NCCL_MAX,
+                "min": nccl.NCCL_MIN,
+            })
+
+    return backend_flags["nccl_avail"]
+
+
+# Keyval of the ONCCL attribute cached on MPI communicators, created on first
+# use.
+_ONCCL_KEYVAL = None
+
+
+def _cached_onccl(comm: MPI.Comm) -> ONCCL:
+    """
+    Get the ONCCL communicator cached on an MPI communicator.
+
+    It is created on first use, which must happen collectively, and stored
+    as an attribute of the MPI communicator: it is shared by all the Python
+    handles of that communicator and released along with it.
+
+    Parameters:
+    comm (MPI.Comm): The MPI communicator spanning the same processes.
+
+    Returns:
+    ONCCL: The NCCL communicator.
+    """
+    global _ONCCL_KEYVAL
+
+    if _ONCCL_KEYVAL is None:
+        _ONCCL_KEYVAL = MPI.Comm.Create_keyval()
+
+    onccl = comm.Get_attr(_ONCCL_KEYVAL)
+    if onccl is None:
+        onccl = ONCCL(comm)
+        comm.Set_attr(_ONCCL_KEYVAL, onccl)
+
+    return onccl
+
 
 class ONCCL(OCOMM):
-    ...
\ No newline at end of file
+    """Oblivious NCCL communicator.
+
+    Communicates device arrays only. Operations are queued on the current
+    CuPy stream and return without waiting for their completion. The MPI
+    communicator is used to set up the NCCL communicator.
+
+    Parameters:
+    comm (MPI.Comm, optional): The MPI communicator spanning the same
+        processes. Defaults to MPI.COMM_WORLD.
+    """
+    def __init__(
+            self,
+            comm : None | MPI.Comm = None,
+        ):
+
+        if not _ensure_nccl():
+            raise RuntimeError("NCCL is not available.")
+
+        if comm is None:
+            comm = MPI.COMM_WORLD
+
+        self.comm = comm
+        self._rank = comm.Get_rank()
+        self._size = comm.Get_size()
+
+        uid = nccl.get_unique_id() if self._rank == 0 else None
+        uid = comm.bcast(uid, root=0)
+        self.nccl_comm = nccl.NcclCommunicator(self._size, uid, self._rank)
+
+    def _nccl_dtype(self, arr: ArrayLike) -> int:
+        """
+        Get the NCCL datatype matching the dtype of an array.
+
+        Parameters:
+        arr (ArrayLike): The array to communicate.
+
+        Returns:
+        int: The matching NCCL datatype.
+        """
+        try:
+            return _NCCL_DTYPE_MAP[arr.dtype]
+        except KeyError:
+            raise ValueError(f"Unsupported dtype for NCCL communication: {arr.dtype}.")
+
+    def _nccl_op(self, op: str) -> int:
+        """
+        Get the NCCL reduction operation matching an operation name.
+
+        Parameters:
+        op (str): The reduction operation (e.g., 'sum', 'max').
+
+        Returns:
+        int: The matching NCCL operation.
+        """
+        try:
+            return _NCCL_OP_MAP[op]
+        except KeyError:
+            raise ValueError(f"Invalid reduction operation: {op}.")
+
+    def _check_buffers(self, *arrs: ArrayLike) -> None:
+        """
+        Check that arrays can be handed to NCCL, None entries are skipped.
+
+        Parameters:
+        *arrs (ArrayLike): The arrays to communicate.
+
+        Raises:
+        ValueError: If an array is not a C-contiguous device array.
+        """
+        for arr in arrs:
+            if arr is None:
+                continue
+            if not isinstance(arr, cp.ndarray):
+                raise ValueError("NCCL communication needs device arrays.")
+            if not arr.flags.c_contiguous:
+                raise ValueError("NCCL communication needs C-contiguous arrays.")
+
+    # Point-to-point communication (blocking) --------------------------------
+    def send(self, data: ArrayLike, dest: int, tag: int = 0) -> None:
+        """
+        Send data from one process to another.
+
+        Parameters:
+        data (ArrayLike): The data to send.
+        dest (int): The rank of the destination process.
+        tag (int, optional): Unused, NCCL has no message tags. Defaults to 0.
+        """
+        self._check_buffers(data)
+
+        self.nccl_comm.send(
+            data.data.ptr,
+            data.size,
+            self._nccl_dtype(data),
+            dest,
+            cp.cuda.get_current_stream().ptr,
+        )
+
+    def recv(self, buf: ArrayLike, source: int, tag: int = 0) -> None:
+        """
+        Receive data from another process.
+
+        Parameters:
+        buf (ArrayLike): The buffer to receive the data.
+        source (int): The rank of the source process.
+        tag (int, optional): Unused, NCCL has no message tags. Defaults to 0.
+        """
+        self._check_buffers(buf)
+
+        self.nccl_comm.recv(
+            buf.data.ptr,
+            buf.size,
+            self._nccl_dtype(buf),
+            source,
+            cp.cuda.get_current_stream().ptr,
+        )
+
+    # Point-to-point communication (non-blocking) -----------------------------
+    ...
+
+    # Collective communication (blocking) -------------------------------------
+    def bcast(self, data: ArrayLike, root: int = 0) -> ArrayLike:
+        """
+        Broadcast data from one process to all others.
+
+        Parameters:
+        data (ArrayLike): The data to broadcast.
+        root (int, optional): The rank of the root process. Defaults to 0.
+
+        Returns:
+        ArrayLike: The broadcasted data.
+        """
+        self._check_buffers(data)
+
+        self.nccl_comm.bcast(
+            data.data.ptr,
+            data.size,
+            self._nccl_dtype(data),
+            root,
+            cp.cuda.get_current_stream().ptr,
+        )
+
+        return data
+
+    def scatter(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0) -> None:
+        """
+        Scatter data from one process to all others.
+
+        Parameters:
+        send_data (ArrayLike): The data to scatter, only significant on the root.
+        recv_data (ArrayLike): The buffer to receive the scattered data.
+        root (int, optional): The rank of the root process. Defaults to 0.
+        """
+        self._check_buffers(send_data, recv_data)
+
+        dtype = self._nccl_dtype(recv_data)
+        stream = cp.cuda.get_current_stream().ptr
+
+        nccl.groupStart()
+        if self._rank == root:
+            for r in range(self._size):
+                self.nccl_comm.send(
+                    send_data.data.ptr + r * recv_data.nbytes,
+                    recv_data.size,
+                    dtype,
+                    r,
+                    stream,
+                )
+        self.nccl_comm.recv(recv_data.data.ptr, recv_data.size, dtype, root, stream)
+        nccl.groupEnd()
+
+    def gather(self, send_data: ArrayLike, recv_data: ArrayLike, root: int = 0) -> None:
+        """
+        Gather data from all processes to one.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the gathered data, only
+            significant on the root.
+        root (int, optional): The rank of the root process. Defaults to 0.
+        """
+        self._check_buffers(send_data, recv_data)
+
+        dtype = self._nccl_dtype(send_data)
+        stream = cp.cuda.get_current_stream().ptr
+
+        nccl.groupStart()
+        self.nccl_comm.send(send_data.data.ptr, send_data.size, dtype, root, stream)
+        if self._rank == root:
+            for r in range(self._size):
+                self.nccl_comm.recv(
+                    recv_data.data.ptr + r * send_data.nbytes,
+                    send_data.size,
+                    dtype,
+                    r,
+                    stream,
+                )
+        nccl.groupEnd()
+
+    def allgather(self, send_data: ArrayLike, recv_data: ArrayLike) -> None:
+        """
+        Gather data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the gathered data.
+        """
+        self._check_buffers(send_data, recv_data)
+
+        self.nccl_comm.allGather(
+            send_data.data.ptr,
+            recv_data.data.ptr,
+            send_data.size,
+            self._nccl_dtype(send_data),
+            cp.cuda.get_current_stream().ptr,
+        )
+
+    def reduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, root: int = 0) -> None:
+        """
+        Reduce data from all processes to one.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the reduced data, only
+            significant on the root.
+        op (str): The reduction operation (e.g., 'sum', 'max').
+        root (int, optional): The rank of the root process. Defaults to 0.
+        """
+        self._check_buffers(send_data, recv_data)
+
+        # NCCL only writes the receive buffer on the root, elsewhere it may
+        # be None.
+        recv_ptr = send_data.data.ptr if recv_data is None else recv_data.data.ptr
+
+        self.nccl_comm.reduce(
+            send_data.data.ptr,
+            recv_ptr,
+            send_data.size,
+            self._nccl_dtype(send_data),
+            self._nccl_op(op),
+            root,
+            cp.cuda.get_current_stream().ptr,
+        )
+
+    def allreduce(self, send_data: ArrayLike, recv_data: ArrayLike, op: str, async_op: bool = False, compress: None | str = None) -> None | _Req:
+        """
+        Reduce data from all processes to all.
+
+        The reduction is always queued on the current stream.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the reduced data.
+        op (str): The reduction operation (e.g., 'sum', 'max').
+        async_op (bool, optional): If True, return without waiting for the
+            reduction to complete. Defaults to False.
+        compress (str, optional): If 'fp16', floating-point data is cast to
+            float16 for the reduction and cast back, halving the traffic at
+            the cost of precision. Defaults to None.
+
+        Returns:
+        None | _Req: With `async_op`, a request waiting on an event
+            recorded after the reduction.
+
+        Raises:
+        RuntimeError: If `async_op` or `compress` is given within a group,
+            where the reduction is only launched on `group_end`.
+        """
+        self._check_buffers(send_data, recv_data)
+
+        if _group_depth > 0 and (async_op or compress is not None):
+            raise RuntimeError("Asynchronous or compressed allreduces cannot be grouped.")
+
+        stream = cp.cuda.get_current_stream()
+
+        if compress is None:
+            self.nccl_comm.allReduce(
+                send_data.data.ptr,
+                recv_data.data.ptr,
+                send_data.size,
+                self._nccl_dtype(send_data),
+                self._nccl_op(op),
+                stream.ptr,
+            )
+        elif compress == "fp16":
+            if send_data.dtype.kind != "f":
+                raise ValueError(f"Compression needs floating-point data, got {send_data.dtype}.")
+
+            # Cast, reduce in place and cast back, all ordered on the stream.
+            half_data = send_data.astype(cp.float16)
+            self.nccl_comm.allReduce(
+                half_data.data.ptr,
+                half_data.data.ptr,
+                half_data.size,
+                nccl.NCCL_FLOAT16,
+                self._nccl_op(op),
+                stream.ptr,
+            )
+            recv_data[...] = half_data.reshape(recv_data.shape)
+        else:
+            raise ValueError(f"Unsupported compression: {compress}.")
+
+        if async_op:
+            return _Req(stream.record().synchronize)
+
+    def alltoall(self, send_data: ArrayLike, recv_data: ArrayLike) -> None:
+        """
+        Send data from all processes to all.
+
+        Parameters:
+        send_data (ArrayLike): The data to send.
+        recv_data (ArrayLike): The buffer to receive the data.
+        """
+        self._check_buffers(send_data, recv_data)
+
+        dtype = self._nccl_dtype(send_data)
+        stream = cp.cuda.get_current_stream().ptr
+        count = send_data.size // self._size
+        block_nbytes = send_data.nbytes // self._size
+
+        nccl.groupStart()
+        for r in range(self._size):
+            self.nccl_comm.send(send_data.data.ptr + r * block_nbytes, count, dtype, r, stream)
+            self.nccl_comm.recv(recv_data.data.ptr + r * block_nbytes, count, dtype, r, stream)
+        nccl.groupEnd()
+
+    # Collective communication (non-blocking) ---------------------------------
+        ...
+
+    # Grouping ----------------------------------------------------------------
+    def group_start(self) -> None:
+        """
+        Start grouping the following operations.
+
+        NCCL launches the grouped operations together on `group_end`.
+        """
+        global _group_depth
+
+        nccl.groupStart()
+        _group_depth += 1
+
+    def group_end(self) -> None:
+        """
+        Launch the operations grouped since `group_start`.
+        """
+        global _group_depth
+
+        _group_depth -= 1
+        nccl.groupEnd()
+
+    # Synchronization ---------------------------------------------------------
+    def barrier(self) -> None:
+        """
+        Synchronize all processes.
+
+        The queued NCCL operations of this process are completed first.
+        """
+        cp.cuda.get_current_stream().synchronize()
+        self.comm.Barrier()
+
+    # Communicators -----------------------------------------------------------
+    def split(self, color: int, key: int) -> 'OCOMM':
+        """
+        Split the communicator into subgroups.
+
+        Parameters:
+        color (int): Control of subset assignment.
+        key (int): Control of rank assignment.
+
+        Returns:
+        Communicator: A new communicator.
+        """
+        return ONCCL(self.comm.Split(color, key))
+
+    def dup(self) -> 'OCOMM':
+        """
+        Duplicate the communicator.
+
+        Returns:
+        Communicator: A new communicator.
+        """
+        return ONCCL(self.comm.Dup())
+
+    # Process management -------------------------------------------------------
+    def rank(self) -> int:
+        """
+        Get the rank of the process.
+
+        Returns:
+        int: The rank of the process.
+        """
+        return self._rank
+
+    def size(self) -> int:
+        """
+        Get the size of the communicator.
+
+        Returns:
+        int: The size of the communicator.
+        """
+        return self._size
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The package is used from the source tree, without installing it.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
@@ -0,0 +1,39 @@
+import pytest
+
+import pyocomm
+from pyocomm import OBARE, OCOMM, backend_flags, make_comm
+
+
+def test_backend_flags():
+    assert set(backend_flags) == {"cupy_avail", "nccl_avail", "mpi_avail", "mpi_cuda_aware"}
+    # NCCL is only loaded on first use.
+    if backend_flags["cupy_avail"]:
+        assert backend_flags["nccl_avail"] in (None, True, False)
+    else:
+        assert backend_flags["nccl_avail"] is False
+
+
+def test_public_names():
+    for name in pyocomm.__all__:
+        assert hasattr(pyocomm, name)
+
+
+def test_obare_is_ocomm():
+    assert isinstance(OBARE(), OCOMM)
+
+
+def test_make_comm_without_mpi():
+    if backend_flags["mpi_avail"]:
+        pytest.skip("mpi4py is available.")
+
+    assert isinstance(make_comm(), OBARE)
+
+
+def test_odampi_binds_cupy():
+    if not backend_flags["cupy_avail"]:
+        pytest.skip("CuPy is not available.")
+
+    import cupy as cp
+    from pyocomm.odampi import odampi
+
+    assert odampi.cp is cp
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from pyocomm import OBARE
+
+
+@pytest.fixture
+def comm():
+    return OBARE()
+
+
+def test_rank_size(comm):
+    assert comm.rank() == 0
+    assert comm.size() == 1
+
+
+@pytest.mark.parametrize("zero_copy", [True, False])
+def test_send_recv(zero_copy):
+    comm = OBARE(zero_copy=zero_copy)
+    data = np.arange(6, dtype=np.float64)
+    buf = np.empty_like(data)
+
+    comm.send(data, dest=0, tag=3)
+    comm.recv(buf, source=0, tag=3)
+
+    np.testing.assert_array_equal(buf, data)
+
+
+def test_send_copy_mode():
+    comm = OBARE(zero_copy=False)
+    data = np.arange(4, dtype=np.int32)
+    buf = np.empty_like(data)
+
+    comm.send(data, dest=0)
+    data[:] = -1
+    comm.recv(buf, source=0)
+
+    np.testing.assert_array_equal(buf, np.arange(4, dtype=np.int32))
+
+
+def test_recv_without_send(comm):
+    with pytest.raises(ValueError):
+        comm.recv(np.empty(2), source=0)
+
+
+def test_recv_mismatch(comm):
+    comm.send(np.zeros(4, dtype=np.float32), dest=0)
+    with pytest.raises(ValueError):
+        comm.recv(np.empty(4, dtype=np.float64), source=0)
+
+
+def test_bcast(comm):
+    data = np.arange(3)
+    assert comm.bcast(data) is data
+
+    with pytest.raises(ValueError):
+        comm.bcast(data, root=1)
+
+
+@pytest.mark.parametrize("op", ["sum", "prod", "max", "min"])
+def test_allreduce(comm, op):
+    send = np.arange(5, dtype=np.float64)
+    recv = np.empty_like(send)
+
+    comm.allreduce(send, recv, op)
+
+    np.testing.assert_array_equal(recv, send)
+
+
+def test_allreduce_in_place(comm):
+    data = np.arange(5, dtype=np.int64)
+
+    comm.allreduce(data, data, "sum")
+
+    np.testing.assert_array_equal(data, np.arange(5))
+
+
+def test_allreduce_logical(comm):
+    send = np.array([0, 2, 0, -1], dtype=np.int32)
+    recv = np.empty_like(send)
+
+    comm.allreduce(send, recv, "land")
+
+    np.testing.assert_array_equal(recv, [0, 1, 0, 1])
+
+
+def test_allreduce_async(comm):
+    send = np.ones(3)
+    recv = np.empty_like(send)
+
+    req = comm.allreduce(send, recv, "sum", async_op=True)
+    req.wait()
+
+    np.testing.assert_array_equal(recv, send)
+
+
+def test_allreduce_invalid_op(comm):
+    with pytest.raises(ValueError):
+        comm.allreduce(np.ones(2), np.empty(2), "mean")
+
+
+def test_allgather_strided(comm):
+    send = np.arange(12, dtype=np.float32).reshape(3, 4)[:, ::2]
+    recv = np.zeros((3, 4), dtype=np.float32)[:, 1::2]
+
+    comm.allgather(send, recv)
+
+    np.testing.assert_array_equal(recv, send)
+
+
+def test_reduce(comm):
+    send = np.arange(4, dtype=np.float64)
+    recv = np.empty_like(send)
+
+    comm.reduce(send, recv, "max")
+
+    np.testing.assert_array_equal(recv, send)
+
+
+def test_send_copy_mode_device():
+    from pyocomm import backend_flags
+
+    if not backend_flags["cupy_avail"]:
+        pytest.skip("CuPy is not available.")
+
+    import cupy as cp
+
+    comm = OBARE(zero_copy=False)
+    data = cp.arange(4, dtype=cp.int32)
+    buf = cp.empty_like(data)
+
+    comm.send(data, dest=0)
+    data[:] = -1
+    comm.recv(buf, source=0)
+
+    cp.testing.assert_array_equal(buf, cp.arange(4, dtype=cp.int32))
@@ -0,0 +1,178 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("mpi4py")
+
+from pyocomm.odampi.odampi import ODAMPI
+
+
+@pytest.fixture
+def comm():
+    return ODAMPI()
+
+
+def test_coalesce(comm):
+    send = [np.full(3, i, dtype=np.float64) for i in range(3)]
+    recv = [np.empty(3) for _ in range(3)]
+
+    with comm.coalesce():
+        for s, r in zip(send, recv):
+            comm.allreduce(s, r, "sum")
+
+    for i, r in enumerate(recv):
+        np.testing.assert_array_equal(r, np.full(3, i * comm.size()))
+
+
+def test_coalesce_chained(comm):
+    a = np.ones(4)
+    b = np.empty(4)
+    c = np.empty(4)
+
+    with comm.coalesce():
+        comm.allreduce(a, b, "sum")
+        comm.allreduce(b, c, "sum")
+
+    np.testing.assert_array_equal(c, np.full(4, comm.size() ** 2))
+
+
+def test_coalesce_repeated_in_place(comm):
+    a = np.full(4, 2.0)
+
+    with comm.coalesce():
+        comm.allreduce(a, a, "prod")
+        comm.allreduce(a, a, "prod")
+
+    np.testing.assert_array_equal(a, np.full(4, 2.0 ** (comm.size() ** 2)))
+
+
+def test_bcast_float16(comm):
+    data = np.arange(4, dtype=np.float16) if comm.rank() == 0 else np.empty(4, dtype=np.float16)
+
+    comm.bcast(data, root=0)
+
+    np.testing.assert_array_equal(data, np.arange(4, dtype=np.float16))
+
+
+def test_float16_reduction_rejected():
+    from pyocomm.core.mpi_utils import _mpi_dtype
+
+    with pytest.raises(ValueError):
+        _mpi_dtype(np.empty(2, dtype=np.float16), reduction=True)
+
+
+def test_coalesce_mpi_op(comm):
+    from mpi4py import MPI
+
+    send = [np.full(2, comm.rank() + i, dtype=np.float64) for i in range(2)]
+    recv = [np.empty(2) for _ in range(2)]
+
+    with comm.coalesce():
+        for s, r in zip(send, recv):
+            comm.allreduce(s, r, MPI.MAX)
+
+    for i, r in enumerate(recv):
+        np.testing.assert_array_equal(r, np.full(2, comm.size() - 1 + i))
+
+
+def test_allreduce_mpi_op(comm):
+    from mpi4py import MPI
+
+    send = np.full(3, comm.rank(), dtype=np.int64)
+    recv = np.empty_like(send)
+
+    comm.allreduce(send, recv, MPI.MAX)
+
+    np.testing.assert_array_equal(recv, np.full(3, comm.size() - 1))
+
+
+def test_allreduce_in_place(comm):
+    data = np.ones(5)
+
+    comm.allreduce(data, data, "sum")
+
+    np.testing.assert_array_equal(data, np.full(5, comm.size()))
+
+
+def test_allreduce_async_in_place(comm):
+    data = np.ones(5)
+
+    comm.allreduce(data, data, "sum", async_op=True).wait()
+
+    np.testing.assert_array_equal(data, np.full(5, comm.size()))
+
+
+def test_allreduce_non_contiguous(comm):
+    send = np.ones((4, 4))[:, ::2]
+    recv = np.zeros((4, 4))[:, 1::2]
+
+    comm.allreduce(send, recv, "sum")
+
+    np.testing.assert_array_equal(recv, np.full((4, 2), comm.size()))
+
+
+def test_allgather_in_place(comm):
+    recv = np.zeros(2 * comm.size(), dtype=np.int64)
+    send = recv[2 * comm.rank():2 * comm.rank() + 2]
+    send[:] = comm.rank()
+
+    comm.allgather(send, recv)
+
+    np.testing.assert_array_equal(recv, np.repeat(np.arange(comm.size()), 2))
+
+
+def test_reduce_in_place(comm):
+    data = np.ones(3)
+
+    comm.reduce(data, data, "sum", root=0)
+
+    expected = comm.size() if comm.rank() == 0 else 1
+    np.testing.assert_array_equal(data, np.full(3, expected))
+
+
+def test_reduce_recv_none_off_root(comm):
+    send = np.ones(3)
+    recv = np.empty(3) if comm.rank() == 0 else None
+
+    comm.reduce(send, recv, "sum", root=0)
+
+    if comm.rank() == 0:
+        np.testing.assert_array_equal(recv, np.full(3, comm.size()))
+
+
+def test_bcast_non_contiguous(comm):
+    base = np.zeros((4, 4))
+    data = base[:, ::2]
+    if comm.rank() == 0:
+        data[...] = np.arange(8).reshape(4, 2)
+
+    comm.bcast(data, root=0)
+
+    np.testing.assert_array_equal(data, np.arange(8).reshape(4, 2))
+    # The columns outside the view are left untouched.
+    np.testing.assert_array_equal(base[:, 1::2], 0)
+
+
+def test_scatter_uneven(comm):
+    n_rows = 2 * comm.size() + 1
+    send = np.arange(n_rows * 3, dtype=np.float64).reshape(n_rows, 3) if comm.rank() == 0 else None
+
+    rows = n_rows // comm.size() + (comm.rank() < n_rows % comm.size())
+    start = comm.rank() * (n_rows // comm.size()) + min(comm.rank(), n_rows % comm.size())
+    recv = np.empty((rows, 3))
+
+    comm.scatter(send, recv, root=0)
+
+    expected = np.arange(n_rows * 3, dtype=np.float64).reshape(n_rows, 3)[start:start + rows]
+    np.testing.assert_array_equal(recv, expected)
+
+
+def test_isend_irecv(comm):
+    data = np.arange(6, dtype=np.int32)
+    buf = np.empty_like(data)
+
+    recv_req = comm.irecv(buf, source=comm.rank(), tag=7)
+    send_req = comm.isend(data, dest=comm.rank(), tag=7)
+    send_req.wait()
+    recv_req.wait()
+
+    np.testing.assert_array_equal(buf, data)
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("mpi4py")
+
+from pyocomm import OMPI, OCOMM, make_comm
+
+
+@pytest.fixture
+def comm():
+    return OMPI()
+
+
+def test_default_comm(comm):
+    from mpi4py import MPI
+
+    assert comm.comm is MPI.COMM_WORLD
+    assert comm.rank() == MPI.COMM_WORLD.Get_rank()
+    assert comm.size() == MPI.COMM_WORLD.Get_size()
+
+
+def test_make_comm_host_arrays():
+    comm = make_comm(np.zeros(2))
+
+    assert isinstance(comm, OMPI)
+    assert isinstance(comm, OCOMM)
+
+
+def test_bcast(comm):
+    data = np.arange(4, dtype=np.float64) if comm.rank() == 0 else np.empty(4)
+
+    comm.bcast(data, root=0)
+
+    np.testing.assert_array_equal(data, np.arange(4))
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.float64, np.complex128])
+def test_allreduce(comm, dtype):
+    send = np.ones(5, dtype=dtype)
+    recv = np.empty_like(send)
+
+    comm.allreduce(send, recv, "sum")
+
+    np.testing.assert_array_equal(recv, np.full(5, comm.size(), dtype=dtype))
+
+
+def test_allreduce_in_place(comm):
+    data = np.ones(5)
+
+    comm.allreduce(data, data, "sum")
+
+    np.testing.assert_array_equal(data, np.full(5, comm.size()))
+
+
+def test_allreduce_async(comm):
+    send = np.ones(3)
+    recv = np.empty_like(send)
+
+    req = comm.allreduce(send, recv, "max", async_op=True)
+    req.Wait()
+
+    np.testing.assert_array_equal(recv, send)
+
+
+def test_allreduce_async_in_place(comm):
+    data = np.ones(5)
+
+    req = comm.allreduce(data, data, "sum", async_op=True)
+    req.Wait()
+
+    np.testing.assert_array_equal(data, np.full(5, comm.size()))
+
+
+def test_iallgather_in_place(comm):
+    recv = np.zeros(2 * comm.size(), dtype=np.int64)
+    send = recv[2 * comm.rank():2 * comm.rank() + 2]
+    send[:] = comm.rank()
+
+    comm.iallgather(send, recv).Wait()
+
+    np.testing.assert_array_equal(recv, np.repeat(np.arange(comm.size()), 2))
+
+
+def test_allreduce_invalid_op(comm):
+    with pytest.raises(ValueError):
+        comm.allreduce(np.ones(2), np.empty(2), "mean")
+
+
+def test_allgather(comm):
+    send = np.full(2, comm.rank(), dtype=np.int64)
+    recv = np.empty(2 * comm.size(), dtype=np.int64)
+
+    comm.allgather(send, recv)
+
+    np.testing.assert_array_equal(recv, np.repeat(np.arange(comm.size()), 2))
+
+
+def test_send_non_contiguous(comm):
+    data = np.ones((4, 4))[:, ::2]
+
+    with pytest.raises(ValueError):
+        comm.send(data, dest=comm.rank())
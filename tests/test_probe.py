@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from pyocomm import backend_flags
+from pyocomm.core import probe
+
+ENV = "PYOCOMM_MPI_CUDA_AWARE"
+
+
+@pytest.fixture(autouse=True)
+def reset_probe(monkeypatch):
+    # Set first so that monkeypatch restores the variable, the probe writes it.
+    monkeypatch.setenv(ENV, "")
+    monkeypatch.delenv(ENV)
+    monkeypatch.setitem(backend_flags, "mpi_cuda_aware", None)
+    probe.mpi_cuda_aware.cache_clear()
+    yield
+    probe.mpi_cuda_aware.cache_clear()
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "mpi_cuda_aware"
+    monkeypatch.setattr(probe, "_cache_path", lambda: str(path))
+    return path
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / "pyocomm" / "mpi_cuda_aware")
+
+    assert probe._read_cache(path) is None
+
+    probe._write_cache(path, True)
+    assert probe._read_cache(path) is True
+
+    probe._write_cache(path, False)
+    assert probe._read_cache(path) is False
+    # The temporary file is renamed into place.
+    assert os.listdir(os.path.dirname(path)) == ["mpi_cuda_aware"]
+
+
+@pytest.mark.parametrize("content", ["", "yes", "2", "\x00\x01"])
+def test_corrupt_cache_is_a_miss(tmp_path, content):
+    path = tmp_path / "mpi_cuda_aware"
+    path.write_text(content)
+
+    assert probe._read_cache(str(path)) is None
+
+
+def test_write_failure_is_ignored(tmp_path):
+    # A file in place of the cache directory makes the write fail.
+    blocker = tmp_path / "pyocomm"
+    blocker.write_text("")
+
+    probe._write_cache(str(blocker / "mpi_cuda_aware"), True)
+
+    assert blocker.read_text() == ""
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_env_overrides_cache(cache_file, monkeypatch, value):
+    cache_file.write_text(str(int(not value)))
+    monkeypatch.setenv(ENV, str(int(value)))
+    monkeypatch.setitem(backend_flags, "mpi_avail", True)
+    monkeypatch.setitem(backend_flags, "cupy_avail", True)
+
+    assert probe.mpi_cuda_aware() is value
+    assert backend_flags["mpi_cuda_aware"] is value
+
+
+def test_cache_hit_skips_the_check(cache_file, monkeypatch):
+    cache_file.write_text("1")
+    monkeypatch.setitem(backend_flags, "mpi_avail", True)
+    monkeypatch.setitem(backend_flags, "cupy_avail", True)
+
+    assert probe.mpi_cuda_aware() is True
+    # Child processes inherit the outcome.
+    assert os.environ[ENV] == "1"
+
+
+def test_without_cupy(monkeypatch):
+    monkeypatch.setitem(backend_flags, "cupy_avail", False)
+
+    assert probe.mpi_cuda_aware() is False
+    assert backend_flags["mpi_cuda_aware"] is False